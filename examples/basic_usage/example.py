@@ -9,6 +9,9 @@ Shows how to:
 For a full walkthrough, see examples/example/example.py
 """
 
+import io
+import json
+import sys
 from pathlib import Path
 
 from raglineage import RagLineage
@@ -38,15 +41,21 @@ def main():
     print("\nQuerying: 'What is the refund policy?'")
     answer = rag.query("What is the refund policy?", k=3)
     
-    print(f"\nAnswer: {answer.answer}")
-    print(f"\nRetrieved {len(answer.lineage)} lineage nodes:")
-    
+    # Build the whole lineage report in one buffer and write it once,
+    # instead of one print (and one stdout lock) per line
+    buf = io.StringIO()
+    buf.write(f"\nAnswer: {answer.answer}\n")
+    buf.write(f"\nRetrieved {len(answer.lineage)} lineage nodes:\n")
+
     for i, entry in enumerate(answer.lineage, 1):
-        print(f"\n  {i}. Lineage Node: {entry.ln_id[:12]}...")
-        print(f"     Score: {entry.score:.3f}")
-        print(f"     Source: {entry.source.uri}")
-        print(f"     Version: {entry.dataset_version}")
-        print(f"     Transforms: {', '.join(entry.transform_chain)}")
+        buf.write(
+            f"\n  {i}. Lineage Node: {entry.ln_id[:12]}...\n"
+            f"     Score: {entry.score:.3f}\n"
+            f"     Source: {entry.source.uri}\n"
+            f"     Version: {entry.dataset_version}\n"
+            f"     Transforms: {', '.join(entry.transform_chain)}\n"
+        )
+    sys.stdout.write(buf.getvalue())
     
     # Audit the answer
     print("\n\nAuditing answer...")
@@ -59,12 +68,14 @@ def main():
     else:
         print("Risk Flags: None")
     
-    # Show JSON output
+    # Show JSON output, streamed to stdout instead of building one big string
     print("\n\nComplete answer with lineage (JSON):")
-    print(answer.model_dump_json(indent=2))
+    json.dump(answer.model_dump(mode="json"), sys.stdout, indent=2)
+    sys.stdout.write("\n")
     
     print("\n\nAudit report (JSON):")
-    print(audit_report.model_dump_json(indent=2))
+    json.dump(audit_report.model_dump(mode="json"), sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
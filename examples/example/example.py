@@ -11,10 +11,14 @@ This walks through the main features:
 - Filtering results
 """
 
+import io
+import json
+import sys
 from pathlib import Path
 
 from raglineage import RagLineage
 from raglineage.retrieval.filters import FilterConfig
+from raglineage.schemas.lineage_node import PDFSource, TabularSource
 
 
 def main():
@@ -65,21 +69,34 @@ def main():
     query = "What is the refund policy?"
     print(f"\nAsking: '{query}'")
     
-    answer = rag.query(query, k=5)
-    
-    print(f"\nAnswer: {answer.answer[:200]}...")
-    print(f"\nFound {len(answer.lineage)} relevant chunks:")
+    # Fetch a generous k once; the filtered-query section below reuses this
+    # result set instead of paying for a second embed + search
+    answer_large = rag.query(query, k=20)
+    answer = rag.apply_filters(answer_large, FilterConfig(), k=5)
     
+    # Buffer the per-chunk report and flush it in a single write so the
+    # loop doesn't pay one stdout lock per line
+    buf = io.StringIO()
+    buf.write(f"\nAnswer: {answer.answer[:200]}...\n")
+    buf.write(f"\nFound {len(answer.lineage)} relevant chunks:\n")
+
     for i, entry in enumerate(answer.lineage, 1):
-        print(f"\n  {i}. {entry.ln_id}")
-        print(f"     Score: {entry.score:.3f}")
-        print(f"     From: {entry.source.uri}")
-        if hasattr(entry.source, 'page'):
-            print(f"     Page: {entry.source.page}")
-        if hasattr(entry.source, 'row'):
-            print(f"     Row: {entry.source.row}")
-        print(f"     Version: {entry.dataset_version}")
-        print(f"     Transforms: {' -> '.join(entry.transform_chain)}")
+        buf.write(
+            f"\n  {i}. {entry.ln_id}\n"
+            f"     Score: {entry.score:.3f}\n"
+            f"     From: {entry.source.uri}\n"
+        )
+        # isinstance dispatch instead of hasattr, which pays for an
+        # AttributeError on every miss
+        if isinstance(entry.source, PDFSource):
+            buf.write(f"     Page: {entry.source.page}\n")
+        elif isinstance(entry.source, TabularSource):
+            buf.write(f"     Row: {entry.source.row}\n")
+        buf.write(
+            f"     Version: {entry.dataset_version}\n"
+            f"     Transforms: {' -> '.join(entry.transform_chain)}\n"
+        )
+    sys.stdout.write(buf.getvalue())
     
     # Check answer quality
     print("\n" + "=" * 70)
@@ -100,11 +117,15 @@ def main():
     print("Full lineage JSON")
     print("=" * 70)
     
+    # Stream the JSON incrementally instead of materializing the full
+    # indented string in memory first
     print("\nAnswer with lineage:")
-    print(answer.model_dump_json(indent=2))
+    json.dump(answer.model_dump(mode="json"), sys.stdout, indent=2)
+    sys.stdout.write("\n")
     
     print("\n\nAudit report:")
-    print(audit_report.model_dump_json(indent=2))
+    json.dump(audit_report.model_dump(mode="json"), sys.stdout, indent=2)
+    sys.stdout.write("\n")
     
     # Update when files change
     print("\n" + "=" * 70)
@@ -153,7 +174,7 @@ def main():
         min_score=0.5,
     )
     
-    filtered_answer = rag.query("refund policy", k=3, filters=filters)
+    filtered_answer = rag.apply_filters(answer_large, filters, k=3)
     print(f"Found {len(filtered_answer.lineage)} results (all from v1.0)")
     
     # Explore graph connections
@@ -1,6 +1,27 @@
 """raglineage - Lineage-aware RAG engine for auditable, reproducible retrieval."""
 
-from raglineage.api import RagLineage
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from raglineage.api import RagLineage
 
 __version__ = "0.2.9"
 __all__ = ["RagLineage", "__version__"]
+
+
+def __getattr__(name: str):
+    # PEP 562 lazy import: `import raglineage` stays cheap and the heavy
+    # pipeline (faiss, torch, transformers) only loads when RagLineage is
+    # actually touched
+    if name == "RagLineage":
+        from raglineage.api import RagLineage
+
+        # Bind into module globals so later raglineage.RagLineage accesses
+        # are plain dict lookups instead of __getattr__ dispatch
+        globals()["RagLineage"] = RagLineage
+        return RagLineage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -1,18 +1,27 @@
 """High-level API for RagLineage."""
 
+from __future__ import annotations
+
 import fnmatch
+import functools
+from collections import OrderedDict
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
 import yaml
 
 from raglineage.audit.auditor import Auditor
 from raglineage.config import RagLineageConfig
 from raglineage.embedding.base import BaseEmbedder
+from raglineage.embedding.cache import EmbeddingCache
 from raglineage.embedding.local import LocalEmbedder
 from raglineage.ingest.auto import AutoIngestor
 from raglineage.lineage.diff import VersionDiff, compute_diff
 from raglineage.lineage.graph import LineageGraph
+from raglineage.lineage.soa_registry import NodeRegistry
 from raglineage.lineage.versioning import VersionStore
 from raglineage.retrieval.filters import FilterConfig
 from raglineage.retrieval.retriever import Retriever
@@ -24,11 +33,62 @@ from raglineage.store.faiss_store import FAISSStore
 from raglineage.transform.chunkers import SemanticChunkerTransform, SimpleChunkerTransform
 from raglineage.transform.dedupe import DedupeTransform
 from raglineage.transform.normalize import NormalizeTransform
+from raglineage.utils.hashing import set_content_hash_algo
 from raglineage.utils.io import ensure_dir, load_json, save_json
 from raglineage.utils.logging import get_logger
+from raglineage.utils.walk import iter_files
 
 logger = get_logger(__name__)
 
+# Process-level singletons so repeated RagLineage constructions in one
+# process (CLI REPLs, servers, notebooks) reuse the loaded model and index
+_EMBEDDER_CACHE: dict[tuple[str, str], BaseEmbedder] = {}
+_STORE_CACHE: dict[tuple[str, str], BaseVectorStore] = {}
+
+# Minimum file count before build() spins up a process pool; below this the
+# fork/pickle overhead outweighs the parallel parse work
+_PARALLEL_INGEST_THRESHOLD = 8
+
+# Nodes embedded and added to the store per flush during build, bounding the
+# working set to O(batch) instead of O(corpus)
+_BUILD_BATCH_SIZE = 512
+
+
+def _process_source_file(
+    source_file: Path, config: RagLineageConfig, version: str
+) -> list[LineageNode]:
+    """
+    Ingest one file and run the stateless transforms (chunk, normalize).
+
+    Module-level so it can be dispatched to a process pool; deduplication is
+    stateful across files and stays on the main process.
+    """
+    set_content_hash_algo(config.content_hash_algo)
+    if config.chunking_strategy == "semantic":
+        chunker = SemanticChunkerTransform(config.chunk_size, config.chunk_overlap)
+    else:
+        chunker = SimpleChunkerTransform(config.chunk_size, config.chunk_overlap)
+
+    normalize = (
+        NormalizeTransform(aggressive=config.normalize_aggressive)
+        if config.enable_normalize
+        else None
+    )
+
+    ingestor = AutoIngestor(dataset_version=version)
+    nodes: list[LineageNode] = []
+    for ln in ingestor.ingest(source_file):
+        current_nodes = [ln]
+        for transform in [chunker, normalize]:
+            if transform is None:
+                continue
+            new_nodes = []
+            for node in current_nodes:
+                new_nodes.extend(transform.transform(node))
+            current_nodes = new_nodes
+        nodes.extend(current_nodes)
+    return nodes
+
 try:
     from raglineage.embedding.openai import OpenAIEmbedder
 except ImportError:
@@ -38,15 +98,42 @@ except ImportError:
 class RagLineage:
     """High-level API for lineage-aware RAG."""
 
+    __slots__ = (
+        "source",
+        "config",
+        "version_store",
+        "graph",
+        "node_registry",
+        "embedder",
+        "store",
+        "retriever",
+        "auditor",
+        "_audit_cache",
+        "_emb_cache",
+        "_query_cache",
+        "storage_dir",
+    )
+
     def __init__(
         self,
         source: Path | str,
         store_backend: str = "faiss",
         embed_backend: str = "local",
         embed_model: str = "all-MiniLM-L6-v2",
+        embed_batch_size: int = 128,
+        device: Optional[str] = None,
+        fp16: bool = True,
+        ingest_workers: Optional[int] = None,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         chunking_strategy: str = "semantic",
+        index_type: str = "auto",
+        nlist: Optional[int] = None,
+        pq_m: Optional[int] = None,
+        nprobe: int = 8,
+        embed_dtype: str = "fp32",
+        embed_cache: bool = True,
+        content_hash_algo: str = "auto",
         enable_dedupe: bool = True,
         enable_normalize: bool = True,
         normalize_aggressive: bool = False,
@@ -58,25 +145,49 @@ class RagLineage:
         Args:
             source: Source directory or file path
             store_backend: Vector store backend ("faiss")
-            embed_backend: Embedding backend ("local" or "openai")
+            embed_backend: Embedding backend ("local", "local-onnx", or "openai")
             embed_model: Embedding model name
+            embed_batch_size: Batch size for embedding calls
+            device: Torch device for local embedding (default: auto-detect)
+            fp16: Run local embedding model in half precision on GPU/MPS
+            ingest_workers: Process-pool size for ingestion (default: CPU count)
             chunk_size: Chunk size for text splitting
             chunk_overlap: Overlap between chunks
             chunking_strategy: "simple" or "semantic"
+            index_type: FAISS index type ("auto" picks by corpus size; "flat", "hnsw", "ivfpq")
+            nlist: Number of IVF clusters (default: 4*sqrt(N) at build time)
+            pq_m: Number of PQ sub-quantizers (default: dimension // 4)
+            nprobe: Number of IVF clusters probed at query time
+            embed_dtype: Vector storage precision ("fp32", "fp16", or "int8")
+            embed_cache: Cache embeddings by content hash across builds
+            content_hash_algo: Content hash ("auto" prefers xxh3; "sha256" for
+                deployments that need a cryptographic digest)
             enable_dedupe: Enable deduplication
             enable_normalize: Enable normalization
             normalize_aggressive: Use aggressive normalization
             graph_depth: Graph walk depth for retrieval
         """
         self.source = Path(source)
+        set_content_hash_algo(content_hash_algo)
         self.config = RagLineageConfig(
             source=source,
             store_backend=store_backend,
             embed_backend=embed_backend,
             embed_model=embed_model,
+            embed_batch_size=embed_batch_size,
+            device=device,
+            fp16=fp16,
+            ingest_workers=ingest_workers,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             chunking_strategy=chunking_strategy,
+            index_type=index_type,
+            nlist=nlist,
+            pq_m=pq_m,
+            nprobe=nprobe,
+            embed_dtype=embed_dtype,
+            embed_cache=embed_cache,
+            content_hash_algo=content_hash_algo,
             enable_dedupe=enable_dedupe,
             enable_normalize=enable_normalize,
             normalize_aggressive=normalize_aggressive,
@@ -86,11 +197,16 @@ class RagLineage:
         # Initialize components
         self.version_store = VersionStore(self.source)
         self.graph = LineageGraph()
-        self.node_registry: dict[str, LineageNode] = {}
+        self.node_registry: NodeRegistry = NodeRegistry()
         self.embedder: BaseEmbedder | None = None
         self.store: BaseVectorStore | None = None
         self.retriever: Retriever | None = None
         self.auditor: Auditor | None = None
+        # audit() results keyed by the (ln_id, dataset_version) set they depend on
+        self._audit_cache: dict[frozenset[tuple[str, str]], Any] = {}
+        self._emb_cache: EmbeddingCache | None = None
+        # query() answers keyed on (question, k, filters); LRU via OrderedDict
+        self._query_cache: OrderedDict[tuple, AnswerWithLineage] = OrderedDict()
 
         # Storage paths
         self.storage_dir = self.source / ".raglineage"
@@ -127,9 +243,19 @@ class RagLineage:
             "store_backend": data.get("store_backend", "faiss"),
             "embed_backend": data.get("embed_backend", "local"),
             "embed_model": data.get("embed_model", "all-MiniLM-L6-v2"),
+            "embed_batch_size": int(data.get("embed_batch_size", 128)),
+            "device": data.get("device"),
+            "fp16": bool(data.get("fp16", True)),
+            "ingest_workers": data.get("ingest_workers"),
             "chunk_size": int(data.get("chunk_size", 1000)),
             "chunk_overlap": int(data.get("chunk_overlap", 200)),
             "chunking_strategy": data.get("chunking_strategy", "semantic"),
+            "index_type": data.get("index_type", "auto"),
+            "nlist": data.get("nlist"),
+            "pq_m": data.get("pq_m"),
+            "nprobe": int(data.get("nprobe", 8)),
+            "embed_dtype": data.get("embed_dtype", "fp32"),
+            "embed_cache": bool(data.get("embed_cache", True)),
             "enable_dedupe": bool(data.get("enable_dedupe", True)),
             "enable_normalize": bool(data.get("enable_normalize", True)),
             "normalize_aggressive": bool(data.get("normalize_aggressive", False)),
@@ -138,12 +264,29 @@ class RagLineage:
         return cls(**kwargs)
 
     def _initialize_embedder(self) -> BaseEmbedder:
-        """Initialize embedding backend."""
+        """Initialize embedding backend (reused process-wide per backend+model)."""
         if self.embedder is not None:
             return self.embedder
 
+        key = (self.config.embed_backend, self.config.embed_model)
+        cached = _EMBEDDER_CACHE.get(key)
+        if cached is not None:
+            self.embedder = cached
+            return self.embedder
+
         if self.config.embed_backend == "local":
-            self.embedder = LocalEmbedder(self.config.embed_model)
+            self.embedder = LocalEmbedder(
+                self.config.embed_model,
+                batch_size=self.config.embed_batch_size,
+                device=self.config.device,
+                fp16=self.config.fp16,
+            )
+        elif self.config.embed_backend == "local-onnx":
+            from raglineage.embedding.onnx_local import OnnxLocalEmbedder
+
+            self.embedder = OnnxLocalEmbedder(
+                self.config.embed_model, batch_size=self.config.embed_batch_size
+            )
         elif self.config.embed_backend == "openai":
             if OpenAIEmbedder is None:
                 raise ImportError("OpenAI embedder not available. Install with: pip install raglineage[openai]")
@@ -151,26 +294,132 @@ class RagLineage:
         else:
             raise ValueError(f"Unknown embed backend: {self.config.embed_backend}")
 
+        _EMBEDDER_CACHE[key] = self.embedder
         return self.embedder
 
-    def _initialize_store(self) -> BaseVectorStore:
-        """Initialize vector store."""
-        if self.store is not None:
+    def _initialize_store(self, writable: bool = False) -> BaseVectorStore:
+        """
+        Initialize vector store (reused process-wide per backend+location).
+
+        Read paths (query, audit) memory-map trained indexes; build and
+        update pass writable=True to get a mutable in-RAM index, reloading a
+        previously memory-mapped one if needed.
+        """
+        store_path = self.storage_dir / "faiss_index"
+
+        store = self.store or _STORE_CACHE.get(
+            (self.config.store_backend, str(self.storage_dir))
+        )
+        if store is not None:
+            if writable and getattr(store, "readonly", False):
+                store.load(str(store_path), mmap=False)
+            self.store = store
             return self.store
 
         embedder = self._initialize_embedder()
         dimension = embedder.dimension
 
         if self.config.store_backend == "faiss":
-            store_path = self.storage_dir / "faiss_index"
-            self.store = FAISSStore(dimension)
+            self.store = FAISSStore(
+                dimension,
+                index_type=self.config.index_type,
+                nlist=self.config.nlist,
+                pq_m=self.config.pq_m,
+                nprobe=self.config.nprobe,
+                quantization=self.config.embed_dtype,
+            )
             if store_path.exists():
-                self.store.load(str(store_path))
+                self.store.load(str(store_path), mmap=not writable)
         else:
             raise ValueError(f"Unknown store backend: {self.config.store_backend}")
 
+        _STORE_CACHE[(self.config.store_backend, str(self.storage_dir))] = self.store
         return self.store
 
+    def _embed_contents(self, embedder: BaseEmbedder, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts through the content-addressed cache.
+
+        Duplicate texts (cross-file boilerplate that per-file dedupe can't
+        see) are embedded once and scattered back, so embedding FLOPs scale
+        with unique content.
+        """
+        first_seen: dict[str, int] = {}
+        back = [first_seen.setdefault(t, len(first_seen)) for t in texts]
+        unique_texts = list(first_seen)
+        if len(unique_texts) < len(texts):
+            logger.info(
+                f"Embedding {len(unique_texts)} unique of {len(texts)} texts"
+            )
+
+        if not self.config.embed_cache:
+            unique_embeddings = embedder.embed_batch(unique_texts)
+        else:
+            if self._emb_cache is None:
+                self._emb_cache = EmbeddingCache(self.storage_dir, self.config.embed_model)
+            unique_embeddings = self._emb_cache.embed(unique_texts, embedder.embed_batch)
+            self._emb_cache.save()
+
+        if len(unique_texts) == len(texts):
+            return unique_embeddings
+        return unique_embeddings[np.asarray(back)]
+
+    def _ingest_files(self, source_files: list[Path], version: str) -> list[LineageNode]:
+        """
+        Ingest and transform files, in parallel when the corpus is large enough.
+
+        Stateless per-file work (parse, chunk, normalize) fans out to a
+        process pool; deduplication runs sequentially afterwards because its
+        seen-hash state spans files.
+        """
+        worker = functools.partial(_process_source_file, config=self.config, version=version)
+        workers = self.config.ingest_workers or (os.cpu_count() or 1)
+        workers = min(workers, len(source_files) or 1)
+
+        if workers > 1 and len(source_files) >= _PARALLEL_INGEST_THRESHOLD:
+            logger.info(f"Ingesting {len(source_files)} files with {workers} workers")
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                node_lists = list(ex.map(worker, source_files, chunksize=4))
+        else:
+            node_lists = []
+            for source_file in source_files:
+                logger.info(f"Ingesting: {source_file}")
+                node_lists.append(worker(source_file))
+
+        dedupe = DedupeTransform() if self.config.enable_dedupe else None
+        all_nodes: list[LineageNode] = []
+        for nodes in node_lists:
+            if dedupe is None:
+                all_nodes.extend(nodes)
+                continue
+            for node in nodes:
+                all_nodes.extend(dedupe.transform(node))
+        return all_nodes
+
+    def _flush_batch(
+        self,
+        nodes: list[LineageNode],
+        embeddings: np.ndarray,
+        store: BaseVectorStore,
+    ) -> None:
+        """Register a batch of embedded nodes with the graph and store."""
+        for node in nodes:
+            self.node_registry[node.ln_id] = node
+        self.graph.add_nodes_bulk(nodes)
+
+        # Adjacent-chunk edges from the structured fields the chunkers emit,
+        # collected and added in one bulk call
+        edges: list[tuple[str, str, str]] = []
+        for node in nodes:
+            if node.parent_id is not None and node.chunk_index:
+                prev_chunk_id = f"{node.parent_id}_chunk_{node.chunk_index - 1}"
+                if prev_chunk_id in self.node_registry:
+                    edges.append((prev_chunk_id, node.ln_id, "adjacent"))
+        if edges:
+            self.graph.add_edges_bulk(edges)
+
+        store.add_batch([node.ln_id for node in nodes], embeddings)
+
     def _load_graph(self) -> None:
         """Load lineage graph from disk."""
         graph_path = self.storage_dir / "graph.json"
@@ -198,17 +447,21 @@ class RagLineage:
         """
         logger.info(f"Building RAG database version {version} from {self.source}")
 
+        self._audit_cache.clear()
+        self._query_cache.clear()
+        self.auditor = None
+        self.retriever = None
+
         # Initialize components
         embedder = self._initialize_embedder()
-        store = self._initialize_store()
+        store = self._initialize_store(writable=True)
 
         # Collect source files
         source_files: list[Path] = []
         if self.source.is_file():
             source_files.append(self.source)
         elif self.source.is_dir():
-            source_files = list(self.source.rglob("*"))
-            source_files = [f for f in source_files if f.is_file()]
+            source_files = list(iter_files(self.source))
 
         # Apply exclude patterns (glob-style: *.log, .git, __pycache__, etc.)
         if exclude:
@@ -229,59 +482,34 @@ class RagLineage:
         relative_files = [f.relative_to(self.source) for f in source_files]
         self.version_store.create_version(version, relative_files)
 
-        # Initialize transforms
-        if self.config.chunking_strategy == "semantic":
-            chunker = SemanticChunkerTransform(self.config.chunk_size, self.config.chunk_overlap)
-        else:
-            chunker = SimpleChunkerTransform(self.config.chunk_size, self.config.chunk_overlap)
-
-        dedupe = DedupeTransform() if self.config.enable_dedupe else None
-        normalize = (
-            NormalizeTransform(aggressive=self.config.normalize_aggressive)
-            if self.config.enable_normalize
-            else None
-        )
-
         # Ingest and transform
-        ingestor = AutoIngestor(dataset_version=version)
-        all_nodes: list[LineageNode] = []
-
-        for source_file in source_files:
-            logger.info(f"Ingesting: {source_file}")
-            for ln in ingestor.ingest(source_file):
-                # Apply transforms
-                current_nodes = [ln]
-                for transform in [chunker, normalize, dedupe]:
-                    if transform is None:
-                        continue
-                    new_nodes = []
-                    for node in current_nodes:
-                        new_nodes.extend(transform.transform(node))
-                    current_nodes = new_nodes
-
-                all_nodes.extend(current_nodes)
+        all_nodes = self._ingest_files(source_files, version)
 
         # Add to graph and store
         logger.info(f"Adding {len(all_nodes)} nodes to graph and store")
-        embeddings_batch = embedder.embed_batch([node.content for node in all_nodes])
+        if store._needs_training():
+            # Trained index types need the full corpus up front; embed it in
+            # one pass (internally minibatched) and train before adding
+            embeddings_batch = self._embed_contents(
+                embedder, [node.content for node in all_nodes]
+            )
+            store.train(embeddings_batch)
+            self._flush_batch(all_nodes, embeddings_batch, store)
+        else:
+            # Streaming path: embed and flush in bounded batches so peak
+            # memory is O(batch), not O(corpus)
+            for start in range(0, len(all_nodes), _BUILD_BATCH_SIZE):
+                batch = all_nodes[start : start + _BUILD_BATCH_SIZE]
+                embeddings = self._embed_contents(
+                    embedder, [node.content for node in batch]
+                )
+                self._flush_batch(batch, embeddings, store)
 
-        for node, embedding in zip(all_nodes, embeddings_batch):
-            self.node_registry[node.ln_id] = node
-            self.graph.add_node(node)
-            store.add(node.ln_id, embedding)
-
-            # Add graph edges (adjacent chunks)
-            if "_chunk_" in node.ln_id:
-                base_id = node.ln_id.rsplit("_chunk_", 1)[0]
-                chunk_idx = int(node.ln_id.rsplit("_", 1)[1])
-                if chunk_idx > 0:
-                    prev_chunk_id = f"{base_id}_chunk_{chunk_idx - 1}"
-                    if prev_chunk_id in self.node_registry:
-                        self.graph.add_edge(prev_chunk_id, node.ln_id, edge_type="adjacent")
-
-        # Save
-        store.save(str(self.storage_dir / "faiss_index"))
+        # Save: index write runs in the background, overlapping the graph
+        # JSON write; resolved before returning
+        save_future = store.save_async(str(self.storage_dir / "faiss_index"))
         self._save_graph()
+        save_future.result()
         logger.info(f"Build complete: {len(all_nodes)} nodes, version {version}")
 
     def update(self, version: str, changed_only: bool = True) -> None:
@@ -292,6 +520,11 @@ class RagLineage:
             version: New version tag
             changed_only: Only process changed files
         """
+        self._audit_cache.clear()
+        self._query_cache.clear()
+        self.auditor = None
+        self.retriever = None
+
         current_version = self.version_store.get_current_version()
         if current_version is None:
             logger.warning("No current version found, doing full build")
@@ -300,7 +533,7 @@ class RagLineage:
 
         # Load current state
         self._load_graph()
-        store = self._initialize_store()
+        store = self._initialize_store(writable=True)
 
         # Compute diff
         version_from = self.version_store.get_version(current_version)
@@ -314,8 +547,7 @@ class RagLineage:
         if self.source.is_file():
             source_files.append(self.source)
         elif self.source.is_dir():
-            source_files = list(self.source.rglob("*"))
-            source_files = [f for f in source_files if f.is_file()]
+            source_files = list(iter_files(self.source))
 
         relative_files = [f.relative_to(self.source) for f in source_files]
         version_to = self.version_store.create_version(version, relative_files)
@@ -328,54 +560,42 @@ class RagLineage:
             changed_files = [f.path for f in version_to.files]
             logger.info(f"Processing all files: {len(changed_files)}")
 
-        # Process changed files (simplified - in production would remove old nodes)
-        # For now, rebuild changed files
         embedder = self._initialize_embedder()
 
-        # Initialize transforms
-        if self.config.chunking_strategy == "semantic":
-            chunker = SemanticChunkerTransform(self.config.chunk_size, self.config.chunk_overlap)
-        else:
-            chunker = SimpleChunkerTransform(self.config.chunk_size, self.config.chunk_overlap)
-
-        dedupe = DedupeTransform() if self.config.enable_dedupe else None
-        normalize = (
-            NormalizeTransform(aggressive=self.config.normalize_aggressive)
-            if self.config.enable_normalize
-            else None
-        )
-
-        ingestor = AutoIngestor(dataset_version=version)
-        new_nodes: list[LineageNode] = []
-
-        for file_path_str in changed_files:
-            file_path = self.source / file_path_str
-            if not file_path.exists():
-                continue
-
-            logger.info(f"Processing: {file_path}")
-            for ln in ingestor.ingest(file_path):
-                current_nodes = [ln]
-                for transform in [chunker, normalize, dedupe]:
-                    if transform is None:
-                        continue
-                    new_nodes_list = []
-                    for node in current_nodes:
-                        new_nodes_list.extend(transform.transform(node))
-                    current_nodes = new_nodes_list
-
-                new_nodes.extend(current_nodes)
+        # Drop stale nodes for changed files before re-adding, so the index
+        # stays O(live corpus) instead of accreting outdated duplicates
+        changed_uris = {str(self.source / file_path_str) for file_path_str in changed_files}
+        stale_ids = [
+            ln_id
+            for ln_id, node in self.node_registry.items()
+            if node.source.uri in changed_uris
+        ]
+        if stale_ids:
+            logger.info(f"Removing {len(stale_ids)} stale nodes")
+            store.remove_many(stale_ids)
+            for ln_id in stale_ids:
+                self.graph.remove_node(ln_id)
+                del self.node_registry[ln_id]
+
+        changed_paths = [
+            self.source / file_path_str
+            for file_path_str in changed_files
+            if (self.source / file_path_str).exists()
+        ]
+        new_nodes = self._ingest_files(changed_paths, version)
 
         # Add new nodes
         if new_nodes:
-            embeddings_batch = embedder.embed_batch([node.content for node in new_nodes])
-            for node, embedding in zip(new_nodes, embeddings_batch):
+            embeddings_batch = self._embed_contents(embedder, [node.content for node in new_nodes])
+            for node in new_nodes:
                 self.node_registry[node.ln_id] = node
                 self.graph.add_node(node)
-                store.add(node.ln_id, embedding)
+            # One contiguous insert instead of a FAISS call per chunk
+            store.add_batch([node.ln_id for node in new_nodes], embeddings_batch)
 
-            store.save(str(self.storage_dir / "faiss_index"))
+            save_future = store.save_async(str(self.storage_dir / "faiss_index"))
             self._save_graph()
+            save_future.result()
 
         logger.info(f"Update complete: added {len(new_nodes)} nodes, version {version}")
 
@@ -385,6 +605,10 @@ class RagLineage:
         """
         Query the RAG database.
 
+        Repeated identical queries (dashboards, agent chains) are served from
+        a small LRU keyed on (question, k, filters); the cache is cleared by
+        build() and update().
+
         Args:
             question: Query question
             k: Number of results
@@ -393,6 +617,12 @@ class RagLineage:
         Returns:
             Answer with lineage
         """
+        cache_key = (question, k, None if filters is None else filters.cache_key())
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            return cached
+
         if self.retriever is None:
             embedder = self._initialize_embedder()
             store = self._initialize_store()
@@ -409,13 +639,14 @@ class RagLineage:
             top_content = self.node_registry[results[0][0]].content[:200]
             answer_text += f"\n\nRelevant information: {top_content}..."
 
-        # Build lineage entries
+        # Build lineage entries: one registry probe per hit, and the fields
+        # come straight off validated nodes so construction skips validation
         lineage_entries = []
         for ln_id, score in results:
-            if ln_id in self.node_registry:
-                ln = self.node_registry[ln_id]
+            ln = self.node_registry.get(ln_id)
+            if ln is not None:
                 lineage_entries.append(
-                    LineageEntry(
+                    LineageEntry.model_construct(
                         ln_id=ln.ln_id,
                         score=score,
                         source=ln.source,
@@ -424,12 +655,55 @@ class RagLineage:
                     )
                 )
 
-        return AnswerWithLineage(
+        answer = AnswerWithLineage(
             question=question,
             answer=answer_text,
             lineage=lineage_entries,
             metadata={},
         )
+        self._query_cache[cache_key] = answer
+        if len(self._query_cache) > 128:
+            self._query_cache.popitem(last=False)
+        return answer
+
+    def apply_filters(
+        self, answer: AnswerWithLineage, filters: FilterConfig, k: Optional[int] = None
+    ) -> AnswerWithLineage:
+        """
+        Filter an existing answer's lineage without re-querying.
+
+        Pure Python over answer.lineage: fetch once with a generous k, then
+        apply different FilterConfigs to the same result set with no extra
+        embedding or index work.
+
+        Args:
+            answer: Answer from a previous query() call
+            filters: Filter configuration to apply
+            k: Optional cap on the number of surviving entries
+
+        Returns:
+            New AnswerWithLineage with the filtered lineage
+        """
+        entries = []
+        for entry in answer.lineage:
+            if entry.score < filters.min_score:
+                continue
+            if filters.dataset_version and entry.dataset_version != filters.dataset_version:
+                continue
+            if filters.source_uri and entry.source.uri != filters.source_uri:
+                continue
+            if filters.source_type and entry.source.type != filters.source_type:
+                continue
+            entries.append(entry)
+            if k is not None and len(entries) >= k:
+                break
+
+        return AnswerWithLineage(
+            question=answer.question,
+            answer=answer.answer,
+            lineage=entries,
+            metadata=answer.metadata,
+        )
 
     def retrieve(
         self, question: str, k: int = 5, filters: FilterConfig | None = None
@@ -499,17 +773,30 @@ class RagLineage:
         """
         Audit an answer.
 
+        Reports are memoized on the set of (ln_id, dataset_version) pairs in
+        the answer's lineage, since the checks depend only on those; the cache
+        is cleared whenever the index is rebuilt or updated.
+
         Args:
             answer: Answer with lineage
 
         Returns:
             Audit report
         """
+        key = frozenset((e.ln_id, e.dataset_version) for e in answer.lineage)
+        cached = self._audit_cache.get(key)
+        if cached is not None:
+            return cached
+
         if self.auditor is None:
             current_version = self.version_store.get_current_version()
             self.auditor = Auditor(current_version)
 
-        return self.auditor.audit(answer)
+        report = self.auditor.audit(answer)
+        if len(self._audit_cache) >= 1024:
+            self._audit_cache.clear()
+        self._audit_cache[key] = report
+        return report
 
     def stats(self) -> RagLineageStats:
         """
@@ -1,5 +1,7 @@
 """Auditor for generating audit reports."""
 
+from __future__ import annotations
+
 from typing import Optional
 
 from raglineage.audit.checks import (
@@ -24,25 +26,63 @@ class Auditor:
             current_version: Current dataset version for staleness checks
         """
         self.current_version = current_version
+        # Reports keyed on the lineage content they depend on; lifetime is
+        # bounded by the auditor object (rebuilt when the version changes)
+        self._cache: dict[tuple, AuditReport] = {}
 
     def audit(self, answer: AnswerWithLineage) -> AuditReport:
         """
         Generate audit report for an answer.
 
+        The checks are pure functions of the lineage entries and the pinned
+        current version, so reports are memoized on that key; re-auditing an
+        identical answer is a dict lookup.
+
         Args:
             answer: Answer with lineage
 
         Returns:
             Audit report
         """
+        key = (
+            self.current_version,
+            tuple(
+                (e.ln_id, e.dataset_version, tuple(e.transform_chain))
+                for e in answer.lineage
+            ),
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         version_consistency = check_version_consistency(answer)
         staleness_check = check_staleness(answer, self.current_version)
         transform_risk_flags = check_transform_risks(answer)
 
-        return AuditReport(
+        report = AuditReport(
             answer_id=None,
             staleness_check=staleness_check,
             version_consistency=version_consistency,
             transform_risk_flags=transform_risk_flags,
             metadata={},
         )
+        if len(self._cache) >= 1024:
+            self._cache.clear()
+        self._cache[key] = report
+        return report
+
+    def audit_batch(self, answers: list[AnswerWithLineage]) -> list[AuditReport]:
+        """
+        Audit a batch of answers.
+
+        The per-check caches (parsed version numbers, per-chain risk flags)
+        are shared across the batch, so repeated versions and transform
+        chains are only evaluated once.
+
+        Args:
+            answers: Answers with lineage
+
+        Returns:
+            Audit reports, aligned with answers
+        """
+        return [self.audit(answer) for answer in answers]
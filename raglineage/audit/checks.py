@@ -1,5 +1,8 @@
 """Audit checks for answers."""
 
+from __future__ import annotations
+
+import re
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -8,6 +11,17 @@ from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_VERSION_RE = re.compile(r"v?(\d+(?:\.\d+)?)")
+_version_num_cache: dict[str, Optional[float]] = {}
+
+
+def _version_num(version: str) -> Optional[float]:
+    """Parse a version tag like 'v1.2' to a float, memoized per tag."""
+    if version not in _version_num_cache:
+        m = _VERSION_RE.match(version)
+        _version_num_cache[version] = float(m.group(1)) if m else None
+    return _version_num_cache[version]
+
 
 def check_version_consistency(answer: AnswerWithLineage) -> str:
     """
@@ -53,19 +67,17 @@ def check_staleness(
         answer_versions = {entry.dataset_version for entry in answer.lineage}
         if current_version not in answer_versions:
             # Check if versions are significantly different
-            # Simple heuristic: compare version strings
-            try:
-                # Try to extract version numbers (e.g., "v1.0" -> 1.0)
-                current_num = float(current_version.replace("v", ""))
-                answer_nums = [float(v.replace("v", "")) for v in answer_versions]
+            # Simple heuristic: compare version numbers (e.g., "v1.0" -> 1.0)
+            current_num = _version_num(current_version)
+            answer_nums = [
+                n for n in (_version_num(v) for v in answer_versions) if n is not None
+            ]
+            if current_num is not None and answer_nums:
                 max_answer_num = max(answer_nums)
                 if current_num - max_answer_num > 1.0:  # More than 1 major version behind
                     return "fail"
                 elif current_num - max_answer_num > 0.0:
                     return "warning"
-            except ValueError:
-                # Can't parse versions, use default
-                pass
 
     return "pass"
 
@@ -81,18 +93,31 @@ def check_transform_risks(answer: AnswerWithLineage) -> list[str]:
         List of risk flag strings
     """
     risk_flags = []
-    risky_transforms = {
-        "normalize_aggressive": "Aggressive normalization may lose information",
-        "ocr": "OCR may introduce errors",
-        "translation": "Translation may introduce semantic drift",
-        "summarization": "Summarization may lose important details",
-    }
 
     for entry in answer.lineage:
-        for transform in entry.transform_chain:
-            if transform in risky_transforms:
-                risk_msg = risky_transforms[transform]
-                if risk_msg not in risk_flags:
-                    risk_flags.append(risk_msg)
+        for risk_msg in _chain_risks(tuple(entry.transform_chain)):
+            if risk_msg not in risk_flags:
+                risk_flags.append(risk_msg)
 
     return risk_flags
+
+
+_RISKY_TRANSFORMS = {
+    "normalize_aggressive": "Aggressive normalization may lose information",
+    "ocr": "OCR may introduce errors",
+    "translation": "Translation may introduce semantic drift",
+    "summarization": "Summarization may lose important details",
+}
+
+_chain_risk_cache: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _chain_risks(chain: tuple[str, ...]) -> tuple[str, ...]:
+    """Risk messages for a transform chain, memoized per distinct chain."""
+    risks = _chain_risk_cache.get(chain)
+    if risks is None:
+        risks = tuple(
+            _RISKY_TRANSFORMS[t] for t in chain if t in _RISKY_TRANSFORMS
+        )
+        _chain_risk_cache[chain] = risks
+    return risks
@@ -1,22 +1,34 @@
-from typing import Union
 """Configuration dataclasses."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Union
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RagLineageConfig:
     """Configuration for RagLineage."""
 
     source: Union[Path, str]
     store_backend: Literal["faiss"] = "faiss"
-    embed_backend: Literal["local", "openai"] = "local"
+    embed_backend: Literal["local", "local-onnx", "openai"] = "local"
     embed_model: str = "all-MiniLM-L6-v2"
+    embed_batch_size: int = 128
+    device: str | None = None
+    fp16: bool = True
+    ingest_workers: int | None = None
     chunk_size: int = 1000
     chunk_overlap: int = 200
     chunking_strategy: Literal["simple", "semantic"] = "semantic"
+    index_type: Literal["auto", "flat", "hnsw", "ivfpq"] = "auto"
+    nlist: int | None = None
+    pq_m: int | None = None
+    nprobe: int = 8
+    embed_dtype: Literal["fp32", "fp16", "int8"] = "fp32"
+    embed_cache: bool = True
+    content_hash_algo: Literal["auto", "xxh3", "blake3", "blake2b", "sha256"] = "auto"
     enable_dedupe: bool = True
     enable_normalize: bool = True
     normalize_aggressive: bool = False
@@ -1,13 +1,14 @@
 """Embedding backends."""
 
 from raglineage.embedding.base import BaseEmbedder
+from raglineage.embedding.cache import EmbeddingCache
 from raglineage.embedding.local import LocalEmbedder
 
-__all__ = ["BaseEmbedder", "LocalEmbedder"]
+__all__ = ["BaseEmbedder", "EmbeddingCache", "LocalEmbedder"]
 
 try:
-    from raglineage.embedding.openai import OpenAIEmbedder
+    from raglineage.embedding.openai import CachedOpenAIEmbedder, OpenAIEmbedder
 
-    __all__.append("OpenAIEmbedder")
+    __all__.extend(["CachedOpenAIEmbedder", "OpenAIEmbedder"])
 except ImportError:
     pass
@@ -0,0 +1,145 @@
+"""Content-addressed embedding cache to skip re-embedding unchanged chunks."""
+
+import hashlib
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from raglineage.utils.io import ensure_dir, load_json, save_json
+from raglineage.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILE = "emb_cache.json"
+MATRIX_FILE = "emb_cache.npy"
+
+
+class EmbeddingCache:
+    """
+    Persistent cache mapping content hash -> embedding row.
+
+    Vectors are stored in a single float32 matrix on disk (memory-mapped on
+    load) with a JSON index of content-hash -> row. Keys are namespaced by
+    model name, so switching embedding models invalidates the cache.
+    """
+
+    def __init__(self, cache_dir: Path | str, model_name: str) -> None:
+        """
+        Initialize embedding cache.
+
+        Args:
+            cache_dir: Directory for cache files (typically .raglineage)
+            model_name: Embedding model name used to key and invalidate entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        self.index_path = self.cache_dir / INDEX_FILE
+        self.matrix_path = self.cache_dir / MATRIX_FILE
+
+        self._rows: dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._pending: list[np.ndarray] = []
+        self._load()
+
+    def _load(self) -> None:
+        """Load index and memory-mapped matrix from disk."""
+        data = load_json(self.index_path) if self.index_path.exists() else None
+        if data is None:
+            return
+        if data.get("model") != self.model_name:
+            logger.info(
+                f"Embedding cache built with model {data.get('model')!r}, "
+                f"invalidating for {self.model_name!r}"
+            )
+            return
+        if not self.matrix_path.exists():
+            return
+        self._rows = data.get("rows", {})
+        self._matrix = np.load(self.matrix_path, mmap_mode="r")
+
+    def key(self, text: str) -> str:
+        """Compute cache key for a text (keyed by model name)."""
+        return hashlib.blake2b(
+            text.encode("utf-8"), digest_size=16, key=self.model_name.encode()[:64]
+        ).hexdigest()
+
+    def embed(self, texts: list[str], embed_fn: Callable[[list[str]], np.ndarray]) -> np.ndarray:
+        """
+        Embed texts, serving cache hits and delegating misses to embed_fn.
+
+        Args:
+            texts: Texts to embed
+            embed_fn: Fallback batch embedding function for cache misses
+
+        Returns:
+            (N, d) float32 embedding matrix aligned with texts
+        """
+        if not texts:
+            return embed_fn(texts)
+
+        keys = [self.key(t) for t in texts]
+        miss_idx = [i for i, k in enumerate(keys) if k not in self._rows]
+
+        if len(miss_idx) == len(texts):
+            miss_vecs = np.asarray(embed_fn(texts), dtype=np.float32)
+            self._put(keys, miss_vecs)
+            return miss_vecs
+
+        logger.info(f"Embedding cache: {len(texts) - len(miss_idx)}/{len(texts)} hits")
+
+        if miss_idx:
+            miss_vecs = np.asarray(
+                embed_fn([texts[i] for i in miss_idx]), dtype=np.float32
+            )
+            self._put([keys[i] for i in miss_idx], miss_vecs)
+
+        dimension = self._row(keys[0]).shape[0] if keys else 0
+        out = np.empty((len(texts), dimension), dtype=np.float32)
+        for i, k in enumerate(keys):
+            out[i] = self._row(k)
+        return out
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached vector for a key, or None on a miss."""
+        if key not in self._rows:
+            return None
+        return np.asarray(self._row(key), dtype=np.float32)
+
+    def put_many(self, keys: list[str], vectors: np.ndarray) -> None:
+        """Insert vectors for keys; existing keys are left untouched."""
+        self._put(keys, np.asarray(vectors, dtype=np.float32))
+
+    def _row(self, key: str) -> np.ndarray:
+        """Fetch a cached vector by key."""
+        row = self._rows[key]
+        n_stored = 0 if self._matrix is None else self._matrix.shape[0]
+        if row < n_stored:
+            return self._matrix[row]
+        return self._pending[row - n_stored]
+
+    def _put(self, keys: list[str], vectors: np.ndarray) -> None:
+        """Buffer new vectors for the next save()."""
+        n_stored = 0 if self._matrix is None else self._matrix.shape[0]
+        for key, vec in zip(keys, vectors):
+            if key in self._rows:
+                continue
+            self._rows[key] = n_stored + len(self._pending)
+            self._pending.append(np.asarray(vec, dtype=np.float32))
+
+    def save(self) -> None:
+        """Persist index and matrix to disk."""
+        if not self._pending:
+            return
+        ensure_dir(self.cache_dir)
+        parts = [] if self._matrix is None else [np.asarray(self._matrix)]
+        parts.append(np.stack(self._pending))
+        matrix = np.concatenate(parts) if len(parts) > 1 else parts[0]
+        np.save(self.matrix_path, matrix)
+        save_json({"model": self.model_name, "rows": self._rows}, self.index_path)
+        self._pending = []
+        self._matrix = np.load(self.matrix_path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        """Return number of cached vectors."""
+        return len(self._rows)
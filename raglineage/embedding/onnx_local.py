@@ -0,0 +1,94 @@
+"""Local embedding backend served through ONNX Runtime."""
+
+from typing import Optional
+
+import numpy as np
+
+from raglineage.embedding.base import BaseEmbedder
+from raglineage.utils.logging import get_logger
+
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+except ImportError:
+    ORTModelForFeatureExtraction = None
+    AutoTokenizer = None
+
+logger = get_logger(__name__)
+
+
+class OnnxLocalEmbedder(BaseEmbedder):
+    """
+    Local embedder running the model through ONNX Runtime.
+
+    Exports the sentence-transformer model to ONNX on first load and serves it
+    with the CPU execution provider, which is typically several times faster
+    than the PyTorch path for CPU inference. Requires the optional optimum
+    dependency (pip install raglineage[onnx]).
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_size: int = 64,
+        provider: str = "CPUExecutionProvider",
+    ) -> None:
+        """
+        Initialize ONNX local embedder.
+
+        Args:
+            model_name: Hugging Face model name (same names as LocalEmbedder)
+            batch_size: Batch size for encode calls
+            provider: ONNX Runtime execution provider
+        """
+        if ORTModelForFeatureExtraction is None:
+            raise ImportError(
+                "ONNX embedder not available. Install with: pip install raglineage[onnx]"
+            )
+
+        # sentence-transformers short names live under this org on the hub
+        if "/" not in model_name:
+            model_name = f"sentence-transformers/{model_name}"
+
+        logger.info(f"Loading ONNX embedding model: {model_name} ({provider})")
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_name, export=True, provider=provider
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.batch_size = batch_size
+        self._dimension: Optional[int] = None
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Tokenize, run the ONNX session, and mean-pool token embeddings."""
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True, return_tensors="np"
+        )
+        outputs = self.model(**encoded)
+        token_embeddings = np.asarray(outputs.last_hidden_state)
+
+        mask = np.asarray(encoded["attention_mask"])[..., np.newaxis].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        return (summed / counts).astype(np.float32)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text."""
+        return self._encode([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed a batch of texts."""
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        batches = [
+            self._encode(texts[i : i + self.batch_size])
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        return np.concatenate(batches)
+
+    @property
+    def dimension(self) -> int:
+        """Return embedding dimension."""
+        if self._dimension is None:
+            self._dimension = len(self.embed("dummy"))
+        return self._dimension
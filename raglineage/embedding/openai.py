@@ -1,48 +1,257 @@
 """OpenAI embedding backend (optional, requires openai package)."""
 
+import asyncio
+import os
+import sqlite3
+from pathlib import Path
 from typing import Optional
 
 import numpy as np
 
 from raglineage.embedding.base import BaseEmbedder
+from raglineage.utils.hashing import compute_content_hash
 from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI, RateLimitError
 except ImportError:
     OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+    RateLimitError = None  # type: ignore
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # type: ignore
+
+_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
+
+
+class _RateLimited(Exception):
+    """A 429 from the raw aiohttp transport (openai's RateLimitError can
+    only be built from an httpx response, which that path never has)."""
+
+
+_RATE_LIMIT_ERRORS = (
+    (_RateLimited,) if RateLimitError is None else (RateLimitError, _RateLimited)
+)
 
 
 class OpenAIEmbedder(BaseEmbedder):
     """OpenAI embedding backend."""
 
-    def __init__(self, model_name: str = "text-embedding-3-small", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model_name: str = "text-embedding-3-small",
+        api_key: Optional[str] = None,
+        aiohttp_backend: bool = False,
+        storage_dtype: str = "float32",
+    ) -> None:
         """
         Initialize OpenAI embedder.
 
         Args:
             model_name: OpenAI embedding model name
             api_key: OpenAI API key (or use OPENAI_API_KEY env var)
+            aiohttp_backend: POST to the embeddings endpoint directly through
+                a shared aiohttp session instead of the SDK's httpx transport,
+                which degrades under high concurrency (requires aiohttp)
+            storage_dtype: dtype of returned vectors ("float32" or "float16";
+                the API returns 32-bit precision, so float64 is pure waste)
         """
         if OpenAI is None:
             raise ImportError("openai package not installed. Install with: pip install raglineage[openai]")
+        if aiohttp_backend and aiohttp is None:
+            raise ImportError("aiohttp not installed. Install with: pip install aiohttp")
 
         self.client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._async_client = None
+        self.aiohttp_backend = aiohttp_backend
         self.model_name = model_name
+        self.storage_dtype = np.dtype(storage_dtype)
         self._dimension: Optional[int] = None
 
+    # OpenAI caps embedding requests at 2048 inputs / 8191 tokens; stay
+    # comfortably under the token limit with a chars/4 estimate
+    MAX_REQUEST_TOKENS = 8000
+
     def embed(self, text: str) -> np.ndarray:
         """Embed a single text."""
         response = self.client.embeddings.create(model=self.model_name, input=text)
-        return np.array(response.data[0].embedding)
+        return np.asarray(response.data[0].embedding, dtype=self.storage_dtype)
 
     def embed_batch(self, texts: list[str]) -> np.ndarray:
         """Embed a batch of texts."""
-        response = self.client.embeddings.create(model=self.model_name, input=texts)
-        embeddings = [item.embedding for item in response.data]
-        return np.array(embeddings)
+        return self.embed_many(texts)
+
+    def _count_tokens(self, texts: list[str]) -> list[int]:
+        """Token counts per text, exact via tiktoken when installed."""
+        if tiktoken is not None:
+            try:
+                encoding = tiktoken.encoding_for_model(self.model_name)
+            except KeyError:
+                encoding = tiktoken.get_encoding("cl100k_base")
+            return [len(tokens) for tokens in encoding.encode_batch(texts)]
+        return [max(1, len(text) // 4) for text in texts]
+
+    def _pack_bins(self, texts: list[str], batch_size: int) -> list[list[int]]:
+        """
+        First-fit-decreasing bin packing of text indices into requests.
+
+        The token cap, not the input-count cap, usually binds; packing by
+        descending token count fills each request close to the budget, so a
+        few long texts no longer force many near-empty requests.
+        """
+        token_counts = self._count_tokens(texts)
+        order = sorted(range(len(texts)), key=lambda i: token_counts[i], reverse=True)
+
+        bins: list[list[int]] = []
+        bin_tokens: list[int] = []
+        for i in order:
+            tokens = token_counts[i]
+            for b, used in enumerate(bin_tokens):
+                if used + tokens <= self.MAX_REQUEST_TOKENS and len(bins[b]) < batch_size:
+                    bins[b].append(i)
+                    bin_tokens[b] += tokens
+                    break
+            else:
+                bins.append([i])
+                bin_tokens.append(tokens)
+        return bins
+
+    def embed_many(self, texts: list[str], batch_size: int = 256) -> np.ndarray:
+        """
+        Embed texts in as few API requests as possible.
+
+        One request amortizes a network round-trip over hundreds of inputs,
+        so ingest throughput is bounded by tokens per request rather than
+        requests per text. Texts are bin-packed by token count against the
+        endpoint's per-request budget, then output rows are restored to
+        input order.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum inputs per request (endpoint max is 2048)
+
+        Returns:
+            Embeddings as float32 array of shape (len(texts), dim)
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        bins = self._pack_bins(texts, batch_size)
+        result: Optional[np.ndarray] = None
+        for bin_indices in bins:
+            response = self.client.embeddings.create(
+                model=self.model_name, input=[texts[i] for i in bin_indices]
+            )
+            vectors = np.array(
+                [item.embedding for item in response.data], dtype=np.float32
+            )
+            if result is None:
+                result = np.empty(
+                    (len(texts), vectors.shape[1]), dtype=self.storage_dtype
+                )
+            result[bin_indices] = vectors
+        return result
+
+    async def aembed_batch(
+        self, texts: list[str], batch_size: int = 256, concurrency: int = 20
+    ) -> np.ndarray:
+        """
+        Embed texts with multiple requests in flight concurrently.
+
+        The sync client serializes requests, so large corpora are bounded by
+        round-trip latency; keeping up to `concurrency` requests in flight
+        saturates the account's rate budget instead. Rate-limit responses are
+        retried with exponential backoff.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Maximum inputs per request
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Embeddings as float32 array of shape (len(texts), dim)
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        # The session holds pooled connections bound to the running event
+        # loop, so it is scoped to this call: shared across all chunks here,
+        # but never cached on self where a later asyncio.run would find it
+        # attached to a closed loop.
+        session = None
+        if self.aiohttp_backend:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100)
+            )
+        elif self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request_chunk(chunk: list[str]) -> np.ndarray:
+            if self.aiohttp_backend:
+                return await self._post_embeddings(session, chunk)
+            response = await self._async_client.embeddings.create(
+                model=self.model_name, input=chunk
+            )
+            return np.array(
+                [item.embedding for item in response.data], dtype=np.float32
+            )
+
+        async def embed_chunk(chunk: list[str]) -> np.ndarray:
+            async with semaphore:
+                for attempt in range(5):
+                    try:
+                        return await request_chunk(chunk)
+                    except _RATE_LIMIT_ERRORS:
+                        delay = 2**attempt
+                        logger.warning(f"Rate limited, retrying in {delay}s")
+                        await asyncio.sleep(delay)
+                # Final attempt propagates the error
+                return await request_chunk(chunk)
+
+        chunks = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        try:
+            batches = await asyncio.gather(*[embed_chunk(chunk) for chunk in chunks])
+        finally:
+            if session is not None:
+                await session.close()
+        return np.concatenate(batches)
+
+    async def _post_embeddings(
+        self, session: "aiohttp.ClientSession", inputs: list[str]
+    ) -> np.ndarray:
+        """POST a chunk to /v1/embeddings through the shared aiohttp session."""
+        api_key = self._api_key or os.environ.get("OPENAI_API_KEY", "")
+        async with session.post(
+            _EMBEDDINGS_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            json={"model": self.model_name, "input": inputs},
+        ) as response:
+            if response.status == 429:
+                raise _RateLimited(await response.text())
+            response.raise_for_status()
+            payload = await response.json()
+        return np.array(
+            [item["embedding"] for item in payload["data"]], dtype=np.float32
+        )
+
+    def embed_many_concurrent(
+        self, texts: list[str], batch_size: int = 256, concurrency: int = 20
+    ) -> np.ndarray:
+        """Sync wrapper around aembed_batch for non-async callers."""
+        return asyncio.run(self.aembed_batch(texts, batch_size, concurrency))
 
     @property
     def dimension(self) -> int:
@@ -52,3 +261,178 @@ class OpenAIEmbedder(BaseEmbedder):
             dummy_embedding = self.embed("dummy")
             self._dimension = len(dummy_embedding)
         return self._dimension
+
+
+DEFAULT_CACHE_DB = Path.home() / ".raglineage" / "emb_cache.db"
+
+
+class CachedOpenAIEmbedder(BaseEmbedder):
+    """
+    OpenAI embedder with a persistent content-hash cache.
+
+    Identical texts re-embedded across runs (the common case when
+    re-indexing a mostly-stable corpus) are served from a local SQLite
+    database instead of a network round-trip, eliminating both latency and
+    token cost for hits. Entries are keyed by (content hash, model name) so
+    switching models can't poison results.
+
+    With a semantic_threshold set, near-duplicate misses (whitespace diffs,
+    boilerplate) are also caught: each miss gets a cheap probe vector from a
+    small local model, and a FAISS top-1 lookup against probes of earlier
+    texts reuses the stored OpenAI vector when cosine similarity clears the
+    threshold.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "text-embedding-3-small",
+        api_key: Optional[str] = None,
+        cache_path: Optional[Path] = None,
+        semantic_threshold: Optional[float] = None,
+        probe_model: str = "paraphrase-albert-small-v2",
+    ) -> None:
+        """
+        Initialize cached OpenAI embedder.
+
+        Args:
+            model_name: OpenAI embedding model name
+            api_key: OpenAI API key (or use OPENAI_API_KEY env var)
+            cache_path: SQLite cache location (default: ~/.raglineage/emb_cache.db)
+            semantic_threshold: Cosine similarity above which a near-duplicate
+                reuses a cached vector (e.g. 0.86); None disables the
+                semantic layer
+            probe_model: Small local model used for probe vectors
+        """
+        self.inner = OpenAIEmbedder(model_name, api_key=api_key)
+        self.model_name = model_name
+
+        cache_path = Path(cache_path or DEFAULT_CACHE_DB)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(cache_path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "hash TEXT NOT NULL, model TEXT NOT NULL, dim INT NOT NULL, "
+            "vec BLOB NOT NULL, PRIMARY KEY (hash, model))"
+        )
+        self._db.commit()
+
+        self.semantic_threshold = semantic_threshold
+        self._probe_model = probe_model
+        self._probe_embedder = None
+        self._probe_index = None
+        self._probe_vectors: list[np.ndarray] = []
+
+    def _probe(self, texts: list[str]) -> Optional[np.ndarray]:
+        """Probe vectors from the small local model, or None if unavailable."""
+        if self._probe_embedder is None:
+            try:
+                from raglineage.embedding.local import LocalEmbedder
+
+                self._probe_embedder = LocalEmbedder(self._probe_model)
+            except Exception as exc:  # model download or import failure
+                logger.warning(f"Semantic cache disabled ({exc}); using exact hashes")
+                self.semantic_threshold = None
+                return None
+        # LocalEmbedder normalizes, so inner product == cosine similarity
+        return np.asarray(self._probe_embedder.embed_batch(texts), dtype=np.float32)
+
+    def _semantic_lookup(self, probes: np.ndarray) -> list[Optional[int]]:
+        """Top-1 probe match per row, or None below the threshold."""
+        if self._probe_index is None or self._probe_index.ntotal == 0:
+            return [None] * len(probes)
+        scores, indices = self._probe_index.search(probes, 1)
+        return [
+            int(idx[0]) if score[0] > self.semantic_threshold else None
+            for score, idx in zip(scores, indices)
+        ]
+
+    def _semantic_insert(self, probes: np.ndarray, vectors: np.ndarray) -> None:
+        """Register freshly embedded texts for future near-duplicate hits."""
+        import faiss
+
+        if self._probe_index is None:
+            self._probe_index = faiss.IndexFlatIP(probes.shape[1])
+        self._probe_index.add(probes)
+        self._probe_vectors.extend(np.asarray(vectors, dtype=np.float32))
+
+    def _lookup(self, hashes: list[str]) -> dict[str, np.ndarray]:
+        """Fetch cached vectors for content hashes."""
+        if not hashes:
+            return {}
+        placeholders = ",".join("?" * len(hashes))
+        rows = self._db.execute(
+            f"SELECT hash, vec FROM cache WHERE model = ? AND hash IN ({placeholders})",
+            [self.model_name, *hashes],
+        ).fetchall()
+        return {h: np.frombuffer(vec, dtype=np.float32) for h, vec in rows}
+
+    def _store(self, hashes: list[str], vectors: np.ndarray) -> None:
+        """Insert freshly embedded vectors."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self._db.executemany(
+            "INSERT OR IGNORE INTO cache (hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+            [
+                (h, self.model_name, vec.shape[0], vec.tobytes())
+                for h, vec in zip(hashes, vectors)
+            ],
+        )
+        self._db.commit()
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text through the cache."""
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed texts, hitting the API only for cache misses."""
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        hashes = [compute_content_hash(t) for t in texts]
+        hits = self._lookup(list(dict.fromkeys(hashes)))
+
+        miss_idx = [i for i, h in enumerate(hashes) if h not in hits]
+        if miss_idx:
+            # Unique misses only; duplicates within the batch share one call
+            miss_hashes = list(dict.fromkeys(hashes[i] for i in miss_idx))
+            hash_to_text = {hashes[i]: texts[i] for i in miss_idx}
+
+            probes = None
+            if self.semantic_threshold is not None:
+                probes = self._probe([hash_to_text[h] for h in miss_hashes])
+            if probes is not None:
+                matches = self._semantic_lookup(probes)
+                near_hits = {
+                    h: self._probe_vectors[row]
+                    for h, row in zip(miss_hashes, matches)
+                    if row is not None
+                }
+                if near_hits:
+                    logger.debug(f"Semantic cache: {len(near_hits)} near-dup hits")
+                    self._store(list(near_hits), np.stack(list(near_hits.values())))
+                    hits.update(near_hits)
+                keep = [i for i, row in enumerate(matches) if row is None]
+                miss_hashes = [miss_hashes[i] for i in keep]
+                probes = probes[keep]
+
+            if miss_hashes:
+                miss_vecs = self.inner.embed_batch(
+                    [hash_to_text[h] for h in miss_hashes]
+                )
+                miss_vecs = np.asarray(miss_vecs, dtype=np.float32)
+                self._store(miss_hashes, miss_vecs)
+                hits.update(zip(miss_hashes, miss_vecs))
+                if probes is not None and len(probes):
+                    self._semantic_insert(probes, miss_vecs)
+        else:
+            logger.debug(f"Embedding cache: {len(texts)}/{len(texts)} hits")
+
+        return np.stack([hits[h] for h in hashes])
+
+    @property
+    def dimension(self) -> int:
+        """Return embedding dimension."""
+        return self.inner.dimension
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._db.close()
@@ -1,11 +1,10 @@
-from typing import Union
 """Auto-detecting ingestor that routes to appropriate ingestor."""
 
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Union
 
 from raglineage.ingest.base import BaseIngestor
-from raglineage.ingest.files import FileIngestor
+from raglineage.ingest.files import TEXT_EXTENSIONS, FileIngestor
 from raglineage.ingest.tabular import TabularIngestor
 from raglineage.schemas.lineage_node import LineageNode
 from raglineage.utils.logging import get_logger
@@ -24,27 +23,43 @@ class AutoIngestor(BaseIngestor):
             dataset_version: Dataset version tag
         """
         self.dataset_version = dataset_version
-        self.ingestors: list[BaseIngestor] = [
-            TabularIngestor(dataset_version),
-            FileIngestor(dataset_version),
-        ]
+        tabular = TabularIngestor(dataset_version)
+        files = FileIngestor(dataset_version)
+        self.ingestors: list[BaseIngestor] = [tabular, files]
+        # Suffix dispatch avoids re-running every ingestor's can_ingest
+        # (each one stats the file again) on the per-file hot path
+        self._by_suffix: dict[str, BaseIngestor] = {
+            ".csv": tabular,
+            ".json": tabular,
+            ".parquet": tabular,
+            **{ext: files for ext in TEXT_EXTENSIONS},
+        }
+
+    def _dispatch(self, source: Path) -> BaseIngestor | None:
+        """Pick the ingestor for a source with a single stat call."""
+        if not source.is_file():
+            return None
+        ingestor = self._by_suffix.get(source.suffix.lower())
+        if ingestor is not None:
+            return ingestor
+        # Unknown suffix: fall back to polymorphic detection so custom
+        # ingestors appended to self.ingestors still get a chance
+        for candidate in self.ingestors:
+            if candidate.can_ingest(source):
+                return candidate
+        return None
 
     def can_ingest(self, source: Union[Path, str]) -> bool:
         """Check if any ingestor can handle the source."""
-        source = Path(source)
-        return source.exists() and any(ingestor.can_ingest(source) for ingestor in self.ingestors)
+        return self._dispatch(Path(source)) is not None
 
     def ingest(self, source: Union[Path, str]) -> Iterator[LineageNode]:
         """Auto-detect and use appropriate ingestor."""
         source = Path(source)
-        if not source.exists():
-            logger.warning(f"Source does not exist: {source}")
+        ingestor = self._dispatch(source)
+        if ingestor is None:
+            logger.warning(f"No ingestor found for: {source}")
             return
 
-        for ingestor in self.ingestors:
-            if ingestor.can_ingest(source):
-                logger.debug(f"Using {ingestor.__class__.__name__} for {source}")
-                yield from ingestor.ingest(source)
-                return
-
-        logger.warning(f"No ingestor found for: {source}")
+        logger.debug(f"Using {ingestor.__class__.__name__} for {source}")
+        yield from ingestor.ingest(source)
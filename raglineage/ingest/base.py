@@ -1,13 +1,31 @@
-from typing import Union
 """Base ingestor interface."""
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Union
 
 from raglineage.schemas.lineage_node import LineageNode
 
 
+def _id_pool(n: int) -> list[str]:
+    """
+    Draw n node ids from a single entropy read.
+
+    uuid.uuid4() costs a syscall plus object construction per call; one
+    os.urandom read provides the same 4 random bytes per id for a whole
+    batch of nodes.
+
+    Args:
+        n: Number of ids to generate
+
+    Returns:
+        List of ids of the form 'ln_<8 hex chars>'
+    """
+    raw = os.urandom(4 * n)
+    return [f"ln_{raw[i * 4 : (i + 1) * 4].hex()}" for i in range(n)]
+
+
 class BaseIngestor(ABC):
     """Base interface for data ingestion."""
 
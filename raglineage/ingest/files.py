@@ -1,12 +1,11 @@
-from typing import Union
 """File-based ingestion (text files, markdown, etc.)."""
 
-import uuid
+import mmap
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Union
 
-from raglineage.ingest.base import BaseIngestor
+from raglineage.ingest.base import BaseIngestor, _id_pool
 from raglineage.schemas.lineage_node import FileSource, LineageNode
 from raglineage.utils.hashing import compute_content_hash
 from raglineage.utils.logging import get_logger
@@ -33,6 +32,9 @@ class FileIngestor(BaseIngestor):
         source = Path(source)
         return source.is_file() and source.suffix.lower() in TEXT_EXTENSIONS
 
+    # Above this size, map the file instead of copying it through read()
+    MMAP_THRESHOLD = 1 << 20
+
     def ingest(self, source: Union[Path, str]) -> Iterator[LineageNode]:
         """Ingest text file and yield Lineage Nodes."""
         source = Path(source)
@@ -40,13 +42,25 @@ class FileIngestor(BaseIngestor):
             return
 
         try:
-            content = source.read_text(encoding="utf-8")
+            # Hash the raw bytes (no encode round-trip) and decode exactly
+            # once for the node content; large files are mmapped so the
+            # hash pass streams from the page cache without a full copy
+            with source.open("rb") as f:
+                size = source.stat().st_size
+                if size > self.MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content_hash = compute_content_hash(mm)
+                        content = mm[:].decode("utf-8")
+                else:
+                    data = f.read()
+                    content_hash = compute_content_hash(data)
+                    content = data.decode("utf-8")
+
             if not content.strip():
                 return
 
             # Create a single Lineage Node for the file
-            ln_id = f"ln_{uuid.uuid4().hex[:8]}"
-            content_hash = compute_content_hash(content)
+            ln_id = _id_pool(1)[0]
 
             yield LineageNode(
                 ln_id=ln_id,
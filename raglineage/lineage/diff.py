@@ -1,12 +1,19 @@
 """Version diffing and change detection."""
 
-from typing import Any
+from functools import cached_property
+from typing import Any, Optional
+
+import numpy as np
 
 from raglineage.schemas.dataset import DatasetVersion
 from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Above this many total files the diff switches to sorted numpy arrays;
+# below it, dict-view set algebra wins on setup cost
+_NUMPY_DIFF_THRESHOLD = 10_000
+
 
 class VersionDiff:
     """Result of diffing two dataset versions."""
@@ -15,28 +22,52 @@ class VersionDiff:
         self,
         version_from: str,
         version_to: str,
-        added_files: list[str],
-        removed_files: list[str],
-        modified_files: list[str],
-        unchanged_files: list[str],
+        files_from: dict[str, str],
+        files_to: dict[str, str],
+        _precomputed: Optional[tuple[list[str], list[str], list[str]]] = None,
     ) -> None:
         """
         Initialize version diff.
 
+        Added, removed, and modified files are computed eagerly — they are
+        small on a typical commit. The unchanged set is usually most of the
+        corpus and is only materialized if unchanged_files is accessed.
+
         Args:
             version_from: Source version
             version_to: Target version
-            added_files: Files added in target version
-            removed_files: Files removed in target version
-            modified_files: Files modified (hash changed)
-            unchanged_files: Files unchanged
+            files_from: path -> hash mapping for the source version
+            files_to: path -> hash mapping for the target version
+            _precomputed: (added, removed, modified) lists when the caller
+                already derived them (numpy fast path in compute_diff)
         """
         self.version_from = version_from
         self.version_to = version_to
-        self.added_files = added_files
-        self.removed_files = removed_files
-        self.modified_files = modified_files
-        self.unchanged_files = unchanged_files
+        self._files_from = files_from
+        self._files_to = files_to
+
+        if _precomputed is not None:
+            self.added_files, self.removed_files, self.modified_files = _precomputed
+            return
+
+        # dict-view set algebra runs in C; no Python-level membership tests
+        keys_from, keys_to = files_from.keys(), files_to.keys()
+        self.added_files = list(keys_to - keys_from)
+        self.removed_files = list(keys_from - keys_to)
+        self.modified_files = [
+            path
+            for path in keys_from & keys_to
+            if files_from[path] != files_to[path]
+        ]
+
+    @cached_property
+    def unchanged_files(self) -> list[str]:
+        """Files present in both versions with identical hashes (lazy)."""
+        return [
+            path
+            for path in self._files_from.keys() & self._files_to.keys()
+            if self._files_from[path] == self._files_to[path]
+        ]
 
     def has_changes(self) -> bool:
         """Check if there are any changes."""
@@ -50,16 +81,23 @@ class VersionDiff:
         """Get all changed files (added, removed, modified)."""
         return self.added_files + self.removed_files + self.modified_files
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
+    def to_dict(self, include_unchanged: bool = False) -> dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        Args:
+            include_unchanged: Also materialize the unchanged-file list
+        """
+        result = {
             "version_from": self.version_from,
             "version_to": self.version_to,
             "added_files": self.added_files,
             "removed_files": self.removed_files,
             "modified_files": self.modified_files,
-            "unchanged_files": self.unchanged_files,
         }
+        if include_unchanged:
+            result["unchanged_files"] = self.unchanged_files
+        return result
 
 
 def compute_diff(version_from: DatasetVersion, version_to: DatasetVersion) -> VersionDiff:
@@ -73,27 +111,54 @@ def compute_diff(version_from: DatasetVersion, version_to: DatasetVersion) -> Ve
     Returns:
         VersionDiff object
     """
-    files_from = {f.path: f.hash for f in version_from.files}
-    files_to = {f.path: f.hash for f in version_to.files}
-
-    added_files = [path for path in files_to if path not in files_from]
-    removed_files = [path for path in files_from if path not in files_to]
-    modified_files = [
-        path
-        for path in files_from
-        if path in files_to and files_from[path] != files_to[path]
-    ]
-    unchanged_files = [
-        path
-        for path in files_from
-        if path in files_to and files_from[path] == files_to[path]
-    ]
+    if len(version_from.files) + len(version_to.files) >= _NUMPY_DIFF_THRESHOLD:
+        return _compute_diff_numpy(version_from, version_to)
 
+    # zip over the columnar arrays avoids two pydantic attribute reads per
+    # FileEntry, which dominate diff time on large manifests
     return VersionDiff(
         version_from=version_from.version,
         version_to=version_to.version,
-        added_files=added_files,
-        removed_files=removed_files,
-        modified_files=modified_files,
-        unchanged_files=unchanged_files,
+        files_from=dict(zip(version_from.paths_array, version_from.hashes_array)),
+        files_to=dict(zip(version_to.paths_array, version_to.hashes_array)),
+    )
+
+
+def _compute_diff_numpy(
+    version_from: DatasetVersion, version_to: DatasetVersion
+) -> VersionDiff:
+    """
+    Diff two large versions with sorted-array merge instead of dicts.
+
+    isin plus one stable sort per side keeps the whole comparison in C on
+    contiguous string arrays; no path->hash dicts are ever built, and the
+    unchanged list falls out of the same hash-equality mask.
+    """
+    path_from = np.asarray(version_from.paths_array)
+    hash_from = np.asarray(version_from.hashes_array)
+    path_to = np.asarray(version_to.paths_array)
+    hash_to = np.asarray(version_to.hashes_array)
+
+    in_to = np.isin(path_from, path_to, assume_unique=True)
+    in_from = np.isin(path_to, path_from, assume_unique=True)
+
+    # Align the common subsets by sorting each side by path once
+    order_from = np.argsort(path_from[in_to], kind="stable")
+    order_to = np.argsort(path_to[in_from], kind="stable")
+    common_paths = path_from[in_to][order_from]
+    changed = hash_from[in_to][order_from] != hash_to[in_from][order_to]
+
+    diff = VersionDiff(
+        version_from=version_from.version,
+        version_to=version_to.version,
+        files_from={},
+        files_to={},
+        _precomputed=(
+            path_to[~in_from].tolist(),
+            path_from[~in_to].tolist(),
+            common_paths[changed].tolist(),
+        ),
     )
+    # Pre-fill the lazy property; the backing dicts were never built
+    diff.unchanged_files = common_paths[~changed].tolist()
+    return diff
@@ -3,6 +3,12 @@
 from typing import Any, Literal, Optional
 
 import networkx as nx
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from raglineage.schemas.lineage_node import LineageNode
 from raglineage.utils.logging import get_logger
@@ -13,6 +19,47 @@ EdgeType = Literal[
     "adjacent", "semantic", "references", "same_entity", "derived", "parent_child"
 ]
 
+if njit is not None:
+
+    @njit(cache=True)
+    def _bfs_levels(
+        indptr: np.ndarray, indices: np.ndarray, start: int, depth: int
+    ) -> np.ndarray:  # pragma: no cover - requires numba
+        """CSR BFS kernel: discovered nodes, sorted within each level."""
+        n = indptr.size - 1
+        visited = np.zeros(n, dtype=np.uint8)
+        visited[start] = 1
+        frontier = np.empty(n, dtype=np.int32)
+        frontier[0] = start
+        frontier_len = 1
+        out = np.empty(n, dtype=np.int32)
+        out_len = 0
+        for _ in range(depth):
+            if frontier_len == 0:
+                break
+            nxt = np.empty(n, dtype=np.int32)
+            nxt_len = 0
+            for i in range(frontier_len):
+                u = frontier[i]
+                for j in range(indptr[u], indptr[u + 1]):
+                    v = indices[j]
+                    if visited[v] == 0:
+                        visited[v] = 1
+                        nxt[nxt_len] = v
+                        nxt_len += 1
+            if nxt_len == 0:
+                break
+            level = np.sort(nxt[:nxt_len])
+            for i in range(nxt_len):
+                out[out_len] = level[i]
+                out_len += 1
+            frontier = level
+            frontier_len = nxt_len
+        return out[:out_len]
+
+else:
+    _bfs_levels = None
+
 
 class LineageGraph:
     """
@@ -21,9 +68,57 @@ class LineageGraph:
     Nodes are ln_id strings, edges are typed relationships.
     """
 
+    __slots__ = ("graph", "_csr_ids", "_csr_index", "_csr_indptr", "_csr_indices")
+
     def __init__(self) -> None:
         """Initialize empty lineage graph."""
         self.graph: nx.DiGraph = nx.DiGraph()
+        # CSR adjacency (undirected view) built lazily for fast traversals
+        self._csr_ids: list[str] = []
+        self._csr_index: dict[str, int] = {}
+        self._csr_indptr: Optional[np.ndarray] = None
+        self._csr_indices: Optional[np.ndarray] = None
+
+    def _invalidate_csr(self) -> None:
+        """Drop the CSR adjacency after a structural change."""
+        self._csr_indptr = None
+
+    def _ensure_csr(self) -> None:
+        """
+        Build CSR adjacency arrays (indptr/indices over int node indices).
+
+        Neighbor expansion then walks contiguous int32 slices instead of
+        chasing per-node dict lookups through networkx.
+        """
+        if self._csr_indptr is not None:
+            return
+
+        self._csr_ids = list(self.graph.nodes)
+        self._csr_index = {ln_id: i for i, ln_id in enumerate(self._csr_ids)}
+
+        n = len(self._csr_ids)
+        m = self.graph.number_of_edges()
+        if m == 0:
+            self._csr_indptr = np.zeros(n + 1, dtype=np.int32)
+            self._csr_indices = np.empty(0, dtype=np.int32)
+            return
+
+        # One pass translating endpoints to ints; everything after is numpy
+        # (bincount for degrees, stable sort-by-head for the bucket fill)
+        ends = np.fromiter(
+            (self._csr_index[v] for edge in self.graph.edges for v in edge),
+            dtype=np.int32,
+            count=2 * m,
+        ).reshape(m, 2)
+        heads = np.concatenate((ends[:, 0], ends[:, 1]))
+        tails = np.concatenate((ends[:, 1], ends[:, 0]))
+
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(heads, minlength=n), out=indptr[1:])
+        order = np.argsort(heads, kind="stable")
+
+        self._csr_indptr = indptr
+        self._csr_indices = tails[order]
 
     def add_node(self, ln: LineageNode) -> None:
         """
@@ -32,6 +127,8 @@ class LineageGraph:
         Args:
             ln: Lineage Node to add
         """
+        # A fresh node has no edges, so an already-built CSR stays valid;
+        # neighbors() answers [] for ids missing from the index
         self.graph.add_node(ln.ln_id, lineage_node=ln)
         logger.debug(f"Added node: {ln.ln_id}")
 
@@ -52,8 +149,53 @@ class LineageGraph:
             raise ValueError(f"Target node not found: {target_id}")
 
         self.graph.add_edge(source_id, target_id, edge_type=edge_type)
+        self._invalidate_csr()
         logger.debug(f"Added edge: {source_id} -> {target_id} ({edge_type})")
 
+    def add_nodes_bulk(self, nodes: list[LineageNode]) -> None:
+        """
+        Add many Lineage Nodes in one networkx call.
+
+        Args:
+            nodes: Lineage Nodes to add
+        """
+        self.graph.add_nodes_from((ln.ln_id, {"lineage_node": ln}) for ln in nodes)
+        logger.debug(f"Added {len(nodes)} nodes in bulk")
+
+    def add_edges_bulk(self, edges: list[tuple[str, str, EdgeType]]) -> None:
+        """
+        Add many edges in one networkx call.
+
+        Args:
+            edges: (source_id, target_id, edge_type) triples; both endpoints
+                must already be in the graph
+        """
+        # Chained edges repeat endpoints heavily; validate each distinct id
+        # once instead of probing twice per edge
+        endpoints = {v for source_id, target_id, _ in edges for v in (source_id, target_id)}
+        for ln_id in endpoints:
+            if ln_id not in self.graph:
+                raise ValueError(f"Node not found: {ln_id}")
+
+        self.graph.add_edges_from(
+            (source_id, target_id, {"edge_type": edge_type})
+            for source_id, target_id, edge_type in edges
+        )
+        self._invalidate_csr()
+        logger.debug(f"Added {len(edges)} edges in bulk")
+
+    def remove_node(self, ln_id: str) -> None:
+        """
+        Remove a node and its edges from the graph.
+
+        Args:
+            ln_id: Node ID to remove
+        """
+        if ln_id in self.graph:
+            self.graph.remove_node(ln_id)
+            self._invalidate_csr()
+            logger.debug(f"Removed node: {ln_id}")
+
     def neighbors(self, ln_id: str, depth: int = 1) -> list[str]:
         """
         Get neighbors of a node up to specified depth.
@@ -68,28 +210,49 @@ class LineageGraph:
         if ln_id not in self.graph:
             return []
 
-        neighbors_set: set[str] = set()
-        current_level = {ln_id}
-        visited = {ln_id}
+        self._ensure_csr()
+        indptr, indices = self._csr_indptr, self._csr_indices
+
+        start_idx = self._csr_index.get(ln_id)
+        if start_idx is None:
+            # Added after the CSR was built, necessarily edge-free
+            return []
+        if depth == 1:
+            # Not worth JIT dispatch for a single slice
+            hop = indices[indptr[start_idx] : indptr[start_idx + 1]]
+            return [self._csr_ids[j] for j in np.unique(hop)]
+
+        if _bfs_levels is not None:
+            found = _bfs_levels(indptr, indices, start_idx, depth)
+            return [self._csr_ids[j] for j in found]
+
+        # BFS on the int arrays: each frontier is one concatenated slice gather
+        visited = np.zeros(len(self._csr_ids), dtype=bool)
+        visited[start_idx] = True
+        frontier = np.array([start_idx], dtype=np.int32)
+        result: list[int] = []
 
         for _ in range(depth):
-            next_level: set[str] = set()
-            for node_id in current_level:
-                for neighbor in self.graph.successors(node_id):
-                    if neighbor not in visited:
-                        neighbors_set.add(neighbor)
-                        next_level.add(neighbor)
-                        visited.add(neighbor)
-                for neighbor in self.graph.predecessors(node_id):
-                    if neighbor not in visited:
-                        neighbors_set.add(neighbor)
-                        next_level.add(neighbor)
-                        visited.add(neighbor)
-            current_level = next_level
-            if not current_level:
+            if len(frontier) == 0:
                 break
+            # Gather all frontier adjacency slices with one fancy-index
+            # instead of a Python loop of per-node slices
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            prefix = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            gather = np.arange(total, dtype=np.int64) + np.repeat(
+                starts - prefix, counts
+            )
+            hop = np.unique(indices[gather])
+            hop = hop[~visited[hop]]
+            visited[hop] = True
+            result.extend(hop.tolist())
+            frontier = hop
 
-        return list(neighbors_set)
+        return [self._csr_ids[j] for j in result]
 
     def get_node(self, ln_id: str) -> LineageNode | None:
         """
@@ -144,6 +307,7 @@ class LineageGraph:
             node_registry: Mapping of ln_id to LineageNode objects
         """
         self.graph.clear()
+        self._invalidate_csr()
 
         # Add nodes
         for ln_id in data.get("nodes", {}):
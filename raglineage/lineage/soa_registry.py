@@ -0,0 +1,15 @@
+"""Node registry backing the hot retrieval path."""
+
+from raglineage.schemas.lineage_node import LineageNode
+
+
+class NodeRegistry(dict[str, LineageNode]):
+    """
+    Registry of Lineage Nodes, keyed by ln_id.
+
+    A plain dict subclass: everything the hot paths do — single-id probes
+    when assembling lineage entries, membership checks during graph
+    expansion, one items() walk per incremental update — runs at C speed
+    on the builtin dict. The named type keeps call sites stable and leaves
+    room for registry-specific helpers.
+    """
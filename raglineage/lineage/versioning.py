@@ -1,12 +1,14 @@
 """Dataset versioning and manifest management."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 from raglineage.schemas.dataset import DatasetManifest, DatasetVersion, FileEntry
 from raglineage.utils.hashing import compute_file_hash
-from raglineage.utils.io import ensure_dir, load_json, save_json
+from raglineage.utils.io import ensure_dir, save_json
 from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +16,38 @@ logger = get_logger(__name__)
 MANIFEST_DIR = ".raglineage"
 MANIFEST_FILE = "manifest.json"
 
+# Below this many files the thread-pool startup cost isn't worth it
+_PARALLEL_HASH_THRESHOLD = 4
+
+
+def _make_entry(
+    root_path: Path,
+    file_path: Path,
+    prev_entries: Optional[dict[str, FileEntry]] = None,
+) -> Optional[FileEntry]:
+    """Stat and hash one file into a FileEntry, or None if it vanished."""
+    full_path = root_path / file_path
+    try:
+        stat = full_path.stat()
+    except OSError:
+        return None
+
+    modified_at = datetime.fromtimestamp(stat.st_mtime)
+    prev = prev_entries.get(str(file_path)) if prev_entries else None
+    if prev is not None and prev.size == stat.st_size and prev.modified_at == modified_at:
+        # Same size and mtime as the previous version: reuse its hash
+        # instead of re-reading the file
+        file_hash = prev.hash
+    else:
+        file_hash = compute_file_hash(full_path)
+
+    return FileEntry(
+        path=str(file_path),
+        hash=file_hash,
+        size=stat.st_size,
+        modified_at=modified_at,
+    )
+
 
 class VersionStore:
     """Manages dataset versions and manifests."""
@@ -28,6 +62,8 @@ class VersionStore:
         self.root_path = Path(root_path)
         self.manifest_path = self.root_path / MANIFEST_DIR / MANIFEST_FILE
         self._manifest: DatasetManifest | None = None
+        # (mtime_ns, size) of the manifest file backing the cached parse
+        self._manifest_stat: tuple[int, int] | None = None
 
     def load_manifest(self) -> DatasetManifest | None:
         """
@@ -36,15 +72,25 @@ class VersionStore:
         Returns:
             Dataset manifest or None if not found
         """
-        if self._manifest is not None:
-            return self._manifest
-
-        data = load_json(self.manifest_path)
-        if data is None:
+        try:
+            stat = self.manifest_path.stat()
+        except OSError:
             return None
 
+        # One stat revalidates the cached parse, so repeated loads cost a
+        # syscall instead of a read + pydantic pass, while picking up
+        # manifests rewritten by another process
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+        if self._manifest is not None and self._manifest_stat == file_stat:
+            return self._manifest
+
         try:
-            self._manifest = DatasetManifest.model_validate(data)
+            # Parse + validate in one pydantic-core pass instead of
+            # json.load followed by model_validate over Python objects
+            self._manifest = DatasetManifest.model_validate_json(
+                self.manifest_path.read_bytes()
+            )
+            self._manifest_stat = file_stat
             return self._manifest
         except Exception as e:
             logger.error(f"Failed to load manifest: {e}")
@@ -60,6 +106,11 @@ class VersionStore:
         ensure_dir(self.manifest_path.parent)
         save_json(manifest.model_dump(mode="json"), self.manifest_path)
         self._manifest = manifest
+        try:
+            stat = self.manifest_path.stat()
+            self._manifest_stat = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            self._manifest_stat = None
         logger.info(f"Saved manifest: {self.manifest_path}")
 
     def create_manifest(self, dataset_name: str) -> DatasetManifest:
@@ -92,7 +143,11 @@ class VersionStore:
         return manifest
 
     def create_version(
-        self, version: str, files: list[Path], metadata: Optional[dict[str, Any]] = None
+        self,
+        version: str,
+        files: list[Path],
+        metadata: Optional[dict[str, Any]] = None,
+        use_mtime_cache: bool = True,
     ) -> DatasetVersion:
         """
         Create a new dataset version.
@@ -101,22 +156,37 @@ class VersionStore:
             version: Version tag
             files: List of file paths (relative to root)
             metadata: Optional version metadata
+            use_mtime_cache: Reuse the previous version's hash for files
+                whose size and mtime are unchanged, skipping the read
 
         Returns:
             New dataset version
         """
-        file_entries = []
-        for file_path in files:
-            full_path = self.root_path / file_path
-            if full_path.exists():
-                file_entries.append(
-                    FileEntry(
-                        path=str(file_path),
-                        hash=compute_file_hash(full_path),
-                        size=full_path.stat().st_size,
-                        modified_at=datetime.fromtimestamp(full_path.stat().st_mtime),
-                    )
+        prev_entries: Optional[dict[str, FileEntry]] = None
+        if use_mtime_cache:
+            manifest = self.load_manifest()
+            current = manifest.current_version if manifest else None
+            prev_version = manifest.get_version(current) if current else None
+            if prev_version is not None:
+                prev_entries = {entry.path: entry for entry in prev_version.files}
+
+        # Hashing many files is embarrassingly parallel read+CPU work;
+        # ex.map keeps manifest order deterministic
+        if len(files) > _PARALLEL_HASH_THRESHOLD:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                entries = ex.map(
+                    lambda fp: _make_entry(self.root_path, fp, prev_entries), files
+                )
+                file_entries = [entry for entry in entries if entry is not None]
+        else:
+            file_entries = [
+                entry
+                for entry in (
+                    _make_entry(self.root_path, fp, prev_entries) for fp in files
                 )
+                if entry is not None
+            ]
 
         version_obj = DatasetVersion(
             version=version,
@@ -2,6 +2,8 @@
 
 from typing import Optional
 
+import numpy as np
+
 from raglineage.schemas.lineage_node import LineageNode
 from raglineage.utils.logging import get_logger
 
@@ -32,6 +34,10 @@ class FilterConfig:
         self.source_type = source_type
         self.min_score = min_score
 
+    def cache_key(self) -> tuple:
+        """Hashable tuple of filter fields, for use as a cache key."""
+        return (self.dataset_version, self.source_uri, self.source_type, self.min_score)
+
 
 def apply_filters(
     results: list[tuple[str, float]], nodes: dict[str, LineageNode], filters: FilterConfig
@@ -47,11 +53,21 @@ def apply_filters(
     Returns:
         Filtered list of (ln_id, score) tuples
     """
+    if not results:
+        return []
+
+    # Score threshold as a single numpy mask instead of a per-entry comparison
+    if filters.min_score > 0.0:
+        scores = np.fromiter((score for _, score in results), dtype=np.float32, count=len(results))
+        keep = np.flatnonzero(scores >= filters.min_score)
+        results = [results[i] for i in keep]
+
+    # Attribute filters need the node objects, so survivors are walked once
+    if not (filters.dataset_version or filters.source_uri or filters.source_type):
+        return [(ln_id, score) for ln_id, score in results if ln_id in nodes]
+
     filtered = []
     for ln_id, score in results:
-        if score < filters.min_score:
-            continue
-
         if ln_id not in nodes:
             continue
 
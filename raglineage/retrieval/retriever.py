@@ -1,5 +1,7 @@
 """Retriever for querying with graph expansion."""
 
+import hashlib
+from collections import OrderedDict
 from typing import Optional
 
 import numpy as np
@@ -23,6 +25,7 @@ class Retriever:
         store: BaseVectorStore,
         graph: LineageGraph,
         node_registry: dict[str, LineageNode],
+        cache_size: int = 128,
     ) -> None:
         """
         Initialize retriever.
@@ -32,11 +35,16 @@ class Retriever:
             store: Vector store
             graph: Lineage graph
             node_registry: Dictionary of ln_id -> LineageNode
+            cache_size: Result cache entries (0 disables caching)
         """
         self.embedder = embedder
         self.store = store
         self.graph = graph
         self.node_registry = node_registry
+        # Results keyed by query-embedding digest; hits skip the vector
+        # search, filtering, and graph walk entirely
+        self._cache: OrderedDict[tuple, list[tuple[str, float]]] = OrderedDict()
+        self._cache_size = cache_size
 
     def retrieve(
         self,
@@ -60,6 +68,23 @@ class Retriever:
         # Embed query
         query_embedding = self.embedder.embed(query)
 
+        cache_key = None
+        if self._cache_size > 0:
+            digest = hashlib.blake2b(
+                np.asarray(query_embedding, dtype=np.float32).tobytes(),
+                digest_size=16,
+            ).hexdigest()
+            cache_key = (
+                digest,
+                k,
+                graph_depth,
+                filters.cache_key() if filters else None,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return list(cached)
+
         # Vector search
         results = self.store.search(query_embedding, k=k * 2)  # Get more for filtering
 
@@ -84,5 +109,11 @@ class Retriever:
 
         # Sort by score descending
         results.sort(key=lambda x: x[1], reverse=True)
+        results = results[:k]
+
+        if cache_key is not None:
+            self._cache[cache_key] = list(results)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
-        return results[:k]
+        return results
@@ -1,9 +1,10 @@
 """Dataset manifest and versioning schemas."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class FileEntry(BaseModel):
@@ -25,6 +26,16 @@ class DatasetVersion(BaseModel):
         default_factory=dict, description="Version-specific metadata"
     )
 
+    @cached_property
+    def paths_array(self) -> list[str]:
+        """File paths as a parallel column (diff only needs path + hash)."""
+        return [f.path for f in self.files]
+
+    @cached_property
+    def hashes_array(self) -> list[str]:
+        """File hashes as a parallel column, aligned with paths_array."""
+        return [f.hash for f in self.files]
+
 
 class DatasetManifest(BaseModel):
     """
@@ -61,7 +72,11 @@ class DatasetManifest(BaseModel):
         self.current_version = version.version
         self.updated_at = datetime.utcnow()
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() + "Z"}
+    @field_serializer("created_at", "updated_at")
+    def _serialize_datetime(self, value: datetime) -> str:
+        """UTC timestamps with an explicit Z suffix (Rust-path serializer)."""
+        if value.tzinfo is not None:
+            # Round-tripped values come back tz-aware; normalize so the Z
+            # suffix isn't appended after an existing +00:00 offset
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat() + "Z"
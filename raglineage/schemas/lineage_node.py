@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Literal, Optional, Union
+import sys
+from datetime import datetime, timezone
+from typing import Annotated, Any, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from pydantic import BaseModel, Field
 
 
 class FileSource(BaseModel):
     """Source reference for file-based data."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["file"] = "file"
     uri: str = Field(..., description="File path or URI")
     line_start: Optional[int] = Field(None, description="Starting line number")
@@ -20,6 +29,8 @@ class FileSource(BaseModel):
 class PDFSource(BaseModel):
     """Source reference for PDF documents."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["pdf"] = "pdf"
     uri: str = Field(..., description="PDF file path or URI")
     page: int = Field(..., description="Page number")
@@ -29,6 +40,8 @@ class PDFSource(BaseModel):
 class TabularSource(BaseModel):
     """Source reference for tabular data."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["tabular"] = "tabular"
     uri: str = Field(..., description="Table file path or URI")
     row: int = Field(..., description="Row number (0-indexed)")
@@ -38,13 +51,34 @@ class TabularSource(BaseModel):
 class APISource(BaseModel):
     """Source reference for API data."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["api"] = "api"
     uri: str = Field(..., description="API endpoint URL")
     request_id: Optional[str] = Field(None, description="Request identifier")
     timestamp: Optional[str] = Field(None, description="Request timestamp")
 
 
-SourceRef = Union[FileSource, PDFSource, TabularSource, APISource]
+# Discriminated on "type" so pydantic dispatches straight to the right model
+# instead of trying each union member in turn
+SourceRef = Annotated[
+    Union[FileSource, PDFSource, TabularSource, APISource],
+    Field(discriminator="type"),
+]
+
+
+# Transform chains repeat heavily across nodes (every chunk of a build shares
+# a handful of chains), so the strings are interned and whole chains pooled
+_CHAIN_POOL: dict[tuple[str, ...], list[str]] = {}
+
+
+def intern_chain(chain: list[str]) -> list[str]:
+    """Return a pooled copy of a transform chain with interned strings."""
+    key = tuple(sys.intern(t) for t in chain)
+    pooled = _CHAIN_POOL.get(key)
+    if pooled is None:
+        pooled = _CHAIN_POOL.setdefault(key, list(key))
+    return pooled
 
 
 class LineageNode(BaseModel):
@@ -60,6 +94,10 @@ class LineageNode(BaseModel):
     - Timestamps
     """
 
+    # Nodes are immutable once built (updates go through model_copy), which
+    # also lets chunks share source objects safely across transforms
+    model_config = ConfigDict(frozen=True)
+
     ln_id: str = Field(..., description="Stable, deterministic Lineage Node ID")
     content: str = Field(..., description="The actual text content")
     source: SourceRef = Field(..., description="Precise reference to origin")
@@ -74,15 +112,76 @@ class LineageNode(BaseModel):
         default_factory=datetime.utcnow, description="Creation timestamp"
     )
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
+    parent_id: Optional[str] = Field(
+        None, description="ID of the pre-chunking node this chunk came from"
+    )
+    chunk_index: Optional[int] = Field(
+        None, description="Position of this chunk within its parent"
+    )
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
 
-    def model_dump_json(self, **kwargs: Any) -> str:
-        """Override to ensure datetime serialization."""
-        return super().model_dump_json(**kwargs)
-
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {datetime: lambda v: v.isoformat() + "Z"}
+    @field_validator("transform_chain")
+    @classmethod
+    def _intern_transform_chain(cls, chain: list[str]) -> list[str]:
+        """Share one backing list per distinct chain across all nodes."""
+        return intern_chain(chain)
+
+    @field_serializer("created_at", "updated_at")
+    def _serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
+        """UTC timestamps with an explicit Z suffix (Rust-path serializer)."""
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            # Round-tripped values come back tz-aware; normalize so the Z
+            # suffix isn't appended after an existing +00:00 offset
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat() + "Z"
+
+    @classmethod
+    def unvalidated(cls, **kwargs: Any) -> "LineageNode":
+        """
+        Build a node without validation for trusted, already-typed inputs.
+
+        Thin alias for model_construct so internal bulk paths (and tests
+        with fixed fixtures) read as intentional validation skips.
+        """
+        return cls.model_construct(**kwargs)
+
+    @property
+    def content_hash_bytes(self) -> bytes:
+        """
+        The digest packed as raw bytes (half the size of the hex rendering).
+
+        For indexing nodes by hash in memory; the stored field keeps the
+        self-describing "algo:<hex>" string.
+        """
+        digest = self.content_hash.split(":", 1)[-1]
+        try:
+            return bytes.fromhex(digest)
+        except ValueError:
+            return digest.encode("utf-8")
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize straight from __dict__ with orjson (pydantic fallback).
+
+        Skips pydantic's per-call serializer setup on hot manifest/export
+        paths; datetime options reproduce the Z-suffixed timestamps of
+        model_dump_json.
+        """
+        if orjson is None:
+            return self.model_dump_json().encode("utf-8")
+        return orjson.dumps(
+            self.__dict__,
+            default=_model_dump_default,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        )
+
+
+def _model_dump_default(value: Any) -> Any:
+    """orjson fallback for the nested source models."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
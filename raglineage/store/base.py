@@ -1,6 +1,7 @@
 """Base vector store interface."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 
 import numpy as np
 
@@ -19,6 +20,29 @@ class BaseVectorStore(ABC):
         """
         pass
 
+    def add_batch(self, ln_ids: list[str], embeddings: np.ndarray) -> None:
+        """
+        Add a batch of embeddings in one call.
+
+        Backends override this when a single bulk insert is cheaper than
+        per-vector add() calls.
+
+        Args:
+            ln_ids: Lineage Node IDs, aligned with embeddings rows
+            embeddings: (N, d) embedding matrix
+        """
+        for ln_id, embedding in zip(ln_ids, embeddings):
+            self.add(ln_id, embedding)
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """
+        Train the store on the embedding corpus, if the backend requires it.
+
+        Args:
+            embeddings: (N, d) embedding matrix
+        """
+        pass
+
     @abstractmethod
     def search(self, query_embedding: np.ndarray, k: int = 5) -> list[tuple[str, float]]:
         """
@@ -33,6 +57,24 @@ class BaseVectorStore(ABC):
         """
         pass
 
+    def search_batch(
+        self, query_embeddings: np.ndarray, k: int = 5
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Search for several queries at once.
+
+        Default loops over search(); backends override with a native
+        multi-query call.
+
+        Args:
+            query_embeddings: (nq, d) query matrix
+            k: Number of results per query
+
+        Returns:
+            One (ln_id, score) result list per query row
+        """
+        return [self.search(query, k=k) for query in query_embeddings]
+
     @abstractmethod
     def remove(self, ln_id: str) -> None:
         """
@@ -43,11 +85,44 @@ class BaseVectorStore(ABC):
         """
         pass
 
+    def remove_many(self, ln_ids: list[str]) -> None:
+        """
+        Remove a batch of embeddings.
+
+        Backends override this when one bulk removal beats per-id remove().
+
+        Args:
+            ln_ids: Lineage Node IDs to remove
+        """
+        for ln_id in ln_ids:
+            self.remove(ln_id)
+
     @abstractmethod
     def save(self, path: str) -> None:
         """Save store to disk."""
         pass
 
+    def save_async(self, path: str) -> Future:
+        """
+        Save the store, returning a Future.
+
+        The default runs synchronously; backends with expensive writes
+        override this to save in a background thread.
+
+        Args:
+            path: Store file path
+
+        Returns:
+            Future completing when the store is written
+        """
+        future: Future = Future()
+        try:
+            self.save(path)
+            future.set_result(None)
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
     @abstractmethod
     def load(self, path: str) -> None:
         """Load store from disk."""
@@ -1,117 +1,572 @@
 """FAISS-based vector store implementation."""
 
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+# Idle OpenMP threads busy-wait by default and steal CPU from the embedder;
+# must be set before faiss (and its OpenMP runtime) loads
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
 
 import faiss
 import numpy as np
 
 from raglineage.store.base import BaseVectorStore
 from raglineage.store.mapping import LNMapping
-from raglineage.utils.io import ensure_dir
+from raglineage.utils.io import ensure_dir, load_json, save_json
 from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared single-thread executor for background index writes
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="faiss-save")
+
 
 class FAISSStore(BaseVectorStore):
     """FAISS-based vector store."""
 
-    def __init__(self, dimension: int) -> None:
+    def __init__(
+        self,
+        dimension: int,
+        index_type: str = "flat",
+        nlist: Optional[int] = None,
+        pq_m: Optional[int] = None,
+        nprobe: int = 8,
+        quantization: str = "fp32",
+        metric: str = "ip",
+        device: str = "cpu",
+        n_threads: Optional[int] = None,
+    ) -> None:
         """
         Initialize FAISS store.
 
         Args:
             dimension: Embedding dimension
+            index_type: Index type ("flat", "hnsw", "ivfpq", or "auto" to
+                pick by corpus size at train time)
+            nlist: Number of IVF clusters (default: 4*sqrt(N) at train time)
+            pq_m: Number of PQ sub-quantizers (default: dimension // 4)
+            nprobe: Number of IVF clusters probed at search time
+            quantization: Vector storage precision ("fp32", "fp16", or "int8")
+            metric: "ip" ranks by inner product over L2-normalized vectors
+                (cosine; scores come straight from FAISS), "l2" keeps
+                Euclidean distance with the 1/(1+dist) score mapping
+            device: "cpu" or "gpu"; "gpu" clones the index onto GPU 0 for
+                search (requires the faiss-gpu build) and copies it back to
+                the CPU for save()
+            n_threads: OpenMP threads for FAISS (default: the
+                RAGLINEAGE_OMP_THREADS env var, then logical core count).
+                FAISS parallelizes across query rows, so pin this to
+                physical cores and batch queries to use them
         """
+        if n_threads is None:
+            n_threads = int(os.environ.get("RAGLINEAGE_OMP_THREADS", os.cpu_count() or 1))
+        faiss.omp_set_num_threads(n_threads)
+        logger.info(f"FAISS using {n_threads} OpenMP threads")
         self.dimension = dimension
+        self.index_type = index_type
+        self.nlist = nlist
+        self.pq_m = pq_m
+        self.nprobe = nprobe
+        self.quantization = quantization
+        self.metric = metric
+        if device == "gpu" and not hasattr(faiss, "StandardGpuResources"):
+            raise RuntimeError(
+                "device='gpu' requires the faiss-gpu build; "
+                "this environment has CPU-only FAISS"
+            )
+        self.device = device
+        self._gpu_res = None
         self.index: Optional[faiss.Index] = None
+        self.readonly = False
         self.mapping = LNMapping()
+        self._buf: Optional[np.ndarray] = None
+        self._buf_ids: list[str] = []
+        self._buf_n = 0
+        self._search_cache: OrderedDict[tuple, list[tuple[str, float]]] = OrderedDict()
         self._initialize_index()
 
+    # Corpus-size thresholds for index_type="auto": brute force is fine up to
+    # ~10k vectors, HNSW covers the mid range, IVF-PQ beyond a million
+    AUTO_HNSW_THRESHOLD = 10_000
+    AUTO_IVFPQ_THRESHOLD = 1_000_000
+
+    # RAG query traffic is heavily skewed, so repeated queries short-circuit
+    # FAISS entirely; safe because every mutation clears the cache
+    SEARCH_CACHE_SIZE = 1024
+
+    def _needs_training(self) -> bool:
+        """Check whether the configured index requires a training pass."""
+        return self.index_type in ("ivfpq", "hnsw", "auto") or self.quantization != "fp32"
+
     def _initialize_index(self) -> None:
         """Initialize FAISS index."""
-        # Use L2 distance (Euclidean)
-        self.index = faiss.IndexFlatL2(self.dimension)
+        if self._needs_training():
+            # IVF-PQ and quantized indexes need a training corpus; defer to train()
+            self.index = None
+        else:
+            # The IDMap2 wrapper gives vectors stable int64 ids so stale
+            # entries can be removed in place
+            if self.metric == "ip":
+                flat = faiss.IndexFlatIP(self.dimension)
+            else:
+                flat = faiss.IndexFlatL2(self.dimension)
+            self.index = self._to_device(faiss.IndexIDMap2(flat))
 
-    def add(self, ln_id: str, embedding: np.ndarray) -> None:
-        """Add an embedding."""
+    def _to_device(self, index: faiss.Index) -> faiss.Index:
+        """Clone the index onto GPU 0 when configured for GPU search."""
+        if self.device != "gpu":
+            return index
+        if self._gpu_res is None:
+            self._gpu_res = faiss.StandardGpuResources()
+        return faiss.index_cpu_to_gpu(self._gpu_res, 0, index)
+
+    def _inner_index(self) -> Optional[faiss.Index]:
+        """Return the index beneath the IDMap wrapper, if any."""
         if self.index is None:
-            self._initialize_index()
+            return None
+        if isinstance(self.index, faiss.IndexIDMap2):
+            return faiss.downcast_index(self.index.index)
+        return self.index
+
+    def _faiss_metric(self) -> int:
+        """FAISS metric constant for the configured metric."""
+        return faiss.METRIC_INNER_PRODUCT if self.metric == "ip" else faiss.METRIC_L2
+
+    def _normalize(self, embeddings: np.ndarray) -> np.ndarray:
+        """L2-normalize in place for inner-product indexes (no-op for l2)."""
+        if self.metric == "ip":
+            faiss.normalize_L2(embeddings)
+        return embeddings
+
+    def _set_nprobe(self, nprobe: int) -> None:
+        """Set nprobe on the underlying index when it is IVF-based."""
+        inner = self._inner_index()
+        if inner is not None and hasattr(inner, "nprobe"):
+            inner.nprobe = nprobe
+
+    @property
+    def ef_search(self) -> Optional[int]:
+        """HNSW search beam width, or None for non-HNSW indexes."""
+        inner = self._inner_index()
+        if inner is not None and hasattr(inner, "hnsw"):
+            return inner.hnsw.efSearch
+        return None
 
-        embedding = embedding.astype("float32")
+    @ef_search.setter
+    def ef_search(self, value: int) -> None:
+        """Tune recall vs latency on an HNSW index (ignored otherwise)."""
+        inner = self._inner_index()
+        if inner is not None and hasattr(inner, "hnsw"):
+            inner.hnsw.efSearch = value
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """
+        Train the index on the embedding corpus (no-op for flat fp32 indexes).
+
+        For "ivfpq", builds an IVF{nlist},PQ{m}x8 index via index_factory
+        sized to the corpus (nlist defaults to 4*sqrt(N)) and trains it.
+        For quantization="int8", builds an 8-bit scalar quantizer whose
+        per-dimension range is learned from the corpus.
+
+        Args:
+            embeddings: (N, d) float32 embedding matrix
+        """
+        if not self._needs_training() or self.index is not None:
+            return
+
+        embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+        n = embeddings.shape[0]
+
+        index_type = self.index_type
+        if index_type == "auto":
+            if n < self.AUTO_HNSW_THRESHOLD:
+                index_type = "flat"
+            elif n < self.AUTO_IVFPQ_THRESHOLD:
+                index_type = "hnsw"
+            else:
+                index_type = "ivfpq"
+            logger.info(f"Auto-selected index type {index_type!r} for {n} vectors")
+
+        if index_type == "flat" and self.quantization == "fp32":
+            if self.metric == "ip":
+                flat = faiss.IndexFlatIP(self.dimension)
+            else:
+                flat = faiss.IndexFlatL2(self.dimension)
+            self.index = self._to_device(faiss.IndexIDMap2(flat))
+            return
+
+        metric = self._faiss_metric()
+        if index_type == "hnsw":
+            logger.info(f"Building HNSW32 index for {n} vectors")
+            self.index = faiss.IndexHNSWFlat(self.dimension, 32, metric)
+            # Higher construction beam buys recall once, at build time
+            self.index.hnsw.efConstruction = 200
+        elif index_type == "ivfpq":
+            nlist = self.nlist or max(1, min(int(4 * math.sqrt(n)), n))
+            pq_m = self.pq_m or max(1, self.dimension // 4)
+            factory = f"IVF{nlist},PQ{pq_m}x8"
+            logger.info(f"Training FAISS index: {factory} on {n} vectors")
+            self.index = faiss.index_factory(self.dimension, factory, metric)
+            self.nprobe = max(self.nprobe, int(math.sqrt(nlist)))
+        elif self.quantization == "fp16":
+            logger.info(f"Training fp16 scalar quantizer on {n} vectors")
+            self.index = faiss.IndexScalarQuantizer(
+                self.dimension, faiss.ScalarQuantizer.QT_fp16, metric
+            )
+        else:
+            logger.info(f"Training 8-bit scalar quantizer on {n} vectors")
+            self.index = faiss.IndexScalarQuantizer(
+                self.dimension, faiss.ScalarQuantizer.QT_8bit, metric
+            )
+
+        embeddings = self._normalize(embeddings)
+        self.index.train(embeddings)
+        self.index = self._to_device(faiss.IndexIDMap2(self.index))
+        self._set_nprobe(self.nprobe)
+
+    def begin_bulk(self, capacity: int) -> None:
+        """
+        Preallocate a (capacity, d) staging buffer for bulk inserts.
+
+        While active, add() for fresh ids writes one row into the buffer
+        instead of crossing into FAISS; flush() inserts the accumulated rows
+        with a single add call. Growing the index one row at a time pays an
+        astype copy and a potential realloc per vector.
+
+        Args:
+            capacity: Number of rows to preallocate
+        """
+        self.flush()
+        self._buf = np.empty((capacity, self.dimension), dtype=np.float32)
+        self._buf_ids = []
+        self._buf_n = 0
+
+    def flush(self) -> None:
+        """Insert any buffered vectors with one FAISS add call."""
+        if self._buf is None or self._buf_n == 0:
+            return
+        ln_ids, n = self._buf_ids, self._buf_n
+        self._buf_ids = []
+        self._buf_n = 0
+        self.add_batch(ln_ids, self._buf[:n])
+
+    @contextmanager
+    def bulk_add(self, capacity: int) -> Iterator["FAISSStore"]:
+        """
+        Context manager wrapping begin_bulk()/flush().
+
+        Args:
+            capacity: Number of rows to preallocate
+
+        Yields:
+            This store, with the staging buffer active
+        """
+        self.begin_bulk(capacity)
+        try:
+            yield self
+        finally:
+            self.flush()
+            self._buf = None
+
+    def add(self, ln_id: str, embedding: np.ndarray) -> None:
+        """Add an embedding (replacing any existing vector for the id)."""
+        embedding = np.asarray(embedding, dtype="float32")
         if len(embedding.shape) == 1:
             embedding = embedding.reshape(1, -1)
 
-        idx = self.mapping.add(ln_id)
-        # If index already exists, we need to handle it
-        if idx < self.index.ntotal:
-            # Update existing
-            self.index.reconstruct(idx, embedding[0])
+        existing = self.mapping.get_idx(ln_id)
+        if existing is None:
+            if self._buf is not None:
+                if self._buf_n == len(self._buf):
+                    self.flush()
+                self._buf[self._buf_n] = embedding[0]
+                self._buf_ids.append(ln_id)
+                self._buf_n += 1
+                return
+            # Fresh id: one-row batch through the bulk path
+            self.add_batch([ln_id], embedding)
+            return
+
+        # Replacements bypass the staging buffer; drain it first so the
+        # replaced vector cannot shadow a buffered insert
+        if self.readonly:
+            raise RuntimeError(
+                "Index was memory-mapped read-only; reload with mmap=False to mutate"
+            )
+        self.flush()
+        self._search_cache.clear()
+        if self.index is None:
+            if self._needs_training():
+                raise RuntimeError("Index must be trained before adding vectors")
+            self._initialize_index()
+
+        embedding = self._normalize(np.ascontiguousarray(embedding))
+        ids = np.asarray([existing], dtype="int64")
+        if isinstance(self.index, faiss.IndexIDMap2):
+            self.index.remove_ids(faiss.IDSelectorBatch(ids))
+            self.index.add_with_ids(embedding, ids)
         else:
-            # Add new
             self.index.add(embedding)
 
-    def search(self, query_embedding: np.ndarray, k: int = 5) -> list[tuple[str, float]]:
-        """Search for similar embeddings."""
-        if self.index is None or self.index.ntotal == 0:
-            return []
+    def add_batch(self, ln_ids: list[str], embeddings: np.ndarray) -> None:
+        """
+        Add a batch of embeddings with a single FAISS add call.
 
+        One contiguous float32 insert amortizes the per-call Python/C
+        crossing that per-vector add() pays N times.
+
+        Args:
+            ln_ids: Lineage Node IDs, aligned with embeddings rows
+            embeddings: (N, d) embedding matrix
+        """
+        if len(ln_ids) == 0:
+            return
+        if self.readonly:
+            raise RuntimeError(
+                "Index was memory-mapped read-only; reload with mmap=False to mutate"
+            )
+        self._search_cache.clear()
+        if self.index is None:
+            if self._needs_training():
+                raise RuntimeError("Index must be trained before adding vectors")
+            self._initialize_index()
+
+        fresh_ids = [ln_id for ln_id in ln_ids if self.mapping.get_idx(ln_id) is None]
+        if len(fresh_ids) != len(ln_ids):
+            # Some ids already exist; fall back to the per-vector path that
+            # handles updates in place
+            for ln_id, embedding in zip(ln_ids, embeddings):
+                self.add(ln_id, embedding)
+            return
+
+        indices = np.asarray([self.mapping.add(ln_id) for ln_id in fresh_ids], dtype="int64")
+        embeddings = self._normalize(np.ascontiguousarray(embeddings, dtype="float32"))
+        logger.debug(f"Bulk add: {len(fresh_ids)} vectors in one call")
+        if isinstance(self.index, faiss.IndexIDMap2):
+            self.index.add_with_ids(embeddings, indices)
+        else:
+            self.index.add(embeddings)
+
+    def search(self, query_embedding: np.ndarray, k: int = 5) -> list[tuple[str, float]]:
+        """Search for similar embeddings (LRU-cached per query/k)."""
         query_embedding = query_embedding.astype("float32")
         if len(query_embedding.shape) == 1:
             query_embedding = query_embedding.reshape(1, -1)
 
-        distances, indices = self.index.search(query_embedding, min(k, self.index.ntotal))
+        key = (hashlib.blake2b(query_embedding.tobytes(), digest_size=16).digest(), k)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            return list(cached)
 
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < 0:  # FAISS returns -1 for invalid indices
-                continue
-            ln_id = self.mapping.get_ln_id(int(idx))
-            if ln_id:
-                # Convert L2 distance to similarity score (lower distance = higher similarity)
-                score = 1.0 / (1.0 + float(dist))
-                results.append((ln_id, score))
+        results = self.search_batch(query_embedding, k=k)[0]
+        self._search_cache[key] = list(results)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return results
 
+    def search_batch(
+        self, query_embeddings: np.ndarray, k: int = 5
+    ) -> list[list[tuple[str, float]]]:
+        """
+        Search several queries in one FAISS call.
+
+        FAISS parallelizes across query rows with OpenMP, so a single
+        (nq, d) search both amortizes the Python/C crossing and uses all
+        cores; score conversion is vectorized over the whole result matrix.
+
+        Args:
+            query_embeddings: (nq, d) query matrix
+            k: Number of results per query
+
+        Returns:
+            One (ln_id, score) result list per query row
+        """
+        self.flush()
+        nq = len(query_embeddings)
+        if self.index is None or self.index.ntotal == 0:
+            return [[] for _ in range(nq)]
+
+        queries = self._normalize(
+            np.ascontiguousarray(query_embeddings, dtype="float32")
+        )
+        self._set_nprobe(self.nprobe)
+
+        distances, indices = self.index.search(queries, min(k, self.index.ntotal))
+        if self.metric == "ip":
+            # Inner product over unit vectors is the cosine score
+            scores = distances
+        else:
+            # Convert L2 distance to similarity (lower = more similar)
+            scores = 1.0 / (1.0 + distances)
+
+        # Translate the whole index matrix through the cached object array;
+        # no mapping lookup per hit
+        ids_np = self.mapping.ids_array()
+        results: list[list[tuple[str, float]]] = []
+        for row_scores, row_indices in zip(scores, indices):
+            valid = row_indices >= 0  # FAISS returns -1 for invalid indices
+            ln_ids = ids_np[row_indices[valid]]
+            results.append(
+                [
+                    (ln_id, score)
+                    for ln_id, score in zip(
+                        ln_ids.tolist(), row_scores[valid].tolist()
+                    )
+                    if ln_id is not None  # tombstoned (removed) ids
+                ]
+            )
         return results
 
     def remove(self, ln_id: str) -> None:
-        """Remove an embedding (FAISS doesn't support removal, so we mark it)."""
-        # FAISS doesn't support removal, so we just remove from mapping
-        # In a production system, you might want to rebuild the index
-        self.mapping.remove(ln_id)
-        logger.warning("FAISS doesn't support removal - consider rebuilding index")
+        """Remove an embedding by Lineage Node ID."""
+        self.remove_many([ln_id])
+
+    def remove_many(self, ln_ids: list[str]) -> None:
+        """
+        Remove a batch of embeddings in one remove_ids call.
+
+        Works on IDMap2-wrapped indexes (anything written since ids became
+        stable); legacy positional indexes only drop the mapping entries, as
+        repacking would shift every subsequent id.
+
+        Args:
+            ln_ids: Lineage Node IDs to remove
+        """
+        if self.readonly:
+            raise RuntimeError(
+                "Index was memory-mapped read-only; reload with mmap=False to mutate"
+            )
+        self.flush()
+        self._search_cache.clear()
+        indices = [self.mapping.get_idx(ln_id) for ln_id in ln_ids]
+        indices = [idx for idx in indices if idx is not None]
+        if not indices:
+            return
+
+        if isinstance(self.index, faiss.IndexIDMap2):
+            try:
+                self.index.remove_ids(
+                    faiss.IDSelectorBatch(np.asarray(indices, dtype="int64"))
+                )
+            except RuntimeError:
+                # HNSW graphs don't support removal; the mapping drop below
+                # still hides the vectors from results
+                logger.warning(
+                    "Index type does not support removal; removing from "
+                    "mapping only (rebuild to reclaim space)"
+                )
+        else:
+            logger.warning(
+                "Index predates stable ids; removing from mapping only "
+                "(rebuild to reclaim space)"
+            )
+        for ln_id in ln_ids:
+            self.mapping.remove(ln_id)
 
     def save(self, path: str) -> None:
-        """Save FAISS index and mapping to disk."""
+        """Save FAISS index and mapping to disk (atomic via tmp + rename)."""
+        self.flush()
         path = Path(path)
         ensure_dir(path.parent)
 
-        # Save FAISS index
+        # Save FAISS index; write to a sidecar and rename so readers never
+        # see a half-written file
         if self.index is not None:
-            faiss.write_index(self.index, str(path))
+            index = self.index
+            if self.device == "gpu":
+                index = faiss.index_gpu_to_cpu(index)
+            tmp_path = f"{path}.tmp"
+            faiss.write_index(index, tmp_path)
+            os.replace(tmp_path, path)
 
         # Save mapping
         mapping_path = path.parent / f"{path.stem}_mapping.json"
         self.mapping.save(str(mapping_path))
 
-    def load(self, path: str) -> None:
-        """Load FAISS index and mapping from disk."""
+        # Sidecar metadata so load() can reconstruct the store configuration
+        # (quantization, index type, metric) without re-deriving it
+        meta_path = path.parent / f"{path.stem}_meta.json"
+        save_json(
+            {
+                "index_type": self.index_type,
+                "quantization": self.quantization,
+                "metric": self.metric,
+                "nprobe": self.nprobe,
+                "dimension": self.dimension,
+            },
+            meta_path,
+        )
+
+    def save_async(self, path: str) -> Future:
+        """
+        Save in a background thread, returning a Future.
+
+        Callers must resolve the Future before relying on the files being on
+        disk; the atomic rename in save() keeps concurrent readers safe.
+
+        Args:
+            path: Index file path
+
+        Returns:
+            Future completing when index and mapping are written
+        """
+        return _SAVE_EXECUTOR.submit(self.save, path)
+
+    def load(self, path: str, mmap: bool = True) -> None:
+        """
+        Load FAISS index and mapping from disk.
+
+        Trained (IVF/PQ/SQ) indexes are memory-mapped read-only so the OS
+        page cache serves vectors on demand instead of reading the whole file
+        up front. Flat indexes must stay writable for incremental add(), so
+        they are always read into RAM.
+
+        Args:
+            path: Index file path
+            mmap: Memory-map trained indexes instead of loading into RAM
+        """
         path = Path(path)
         if not path.exists():
             logger.warning(f"FAISS index not found: {path}")
             return
 
+        meta_path = path.parent / f"{path.stem}_meta.json"
+        if meta_path.exists():
+            meta = load_json(meta_path)
+            self.index_type = meta.get("index_type", self.index_type)
+            self.quantization = meta.get("quantization", self.quantization)
+            self.nprobe = meta.get("nprobe", self.nprobe)
+
         # Load FAISS index
-        self.index = faiss.read_index(str(path))
+        if mmap and self._needs_training():
+            self.index = faiss.read_index(
+                str(path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+            self.readonly = True
+        else:
+            self.index = self._to_device(faiss.read_index(str(path)))
+            self.readonly = False
         self.dimension = self.index.d
+        # Score semantics must follow the metric baked into the file
+        self.metric = (
+            "ip" if self.index.metric_type == faiss.METRIC_INNER_PRODUCT else "l2"
+        )
 
         # Load mapping
         mapping_path = path.parent / f"{path.stem}_mapping.json"
         self.mapping.load(str(mapping_path))
+        self._search_cache.clear()
 
     def __len__(self) -> int:
         """Return number of vectors in store."""
-        if self.index is None:
-            return 0
-        return self.index.ntotal
+        total = self._buf_n
+        if self.index is not None:
+            total += self.index.ntotal
+        return total
@@ -2,6 +2,8 @@
 
 from typing import Optional
 
+import numpy as np
+
 from raglineage.utils.io import load_json, save_json
 from raglineage.utils.logging import get_logger
 
@@ -9,13 +11,22 @@ logger = get_logger(__name__)
 
 
 class LNMapping:
-    """Maps Lineage Node IDs to vector store indices."""
+    """
+    Maps Lineage Node IDs to vector store indices.
+
+    Indices are dense 0..N-1, so the reverse direction is a plain list —
+    get_ln_id on the search hot path is a pointer index instead of an int
+    hash and bucket walk, and the list needs no separate serialization
+    (it's rebuilt by inverting ln_id_to_idx). Removed slots are tombstoned
+    with None to keep later indices stable.
+    """
 
     def __init__(self) -> None:
         """Initialize mapping."""
         self.ln_id_to_idx: dict[str, int] = {}
-        self.idx_to_ln_id: dict[int, str] = {}
+        self.idx_to_ln_id: list[Optional[str]] = []
         self.next_idx = 0
+        self._ids_np: Optional[np.ndarray] = None
 
     def add(self, ln_id: str) -> int:
         """
@@ -32,8 +43,9 @@ class LNMapping:
 
         idx = self.next_idx
         self.ln_id_to_idx[ln_id] = idx
-        self.idx_to_ln_id[idx] = ln_id
+        self.idx_to_ln_id.append(ln_id)
         self.next_idx += 1
+        self._ids_np = None
         return idx
 
     def get_idx(self, ln_id: str) -> Optional[int]:
@@ -42,20 +54,21 @@ class LNMapping:
 
     def get_ln_id(self, idx: int) -> Optional[str]:
         """Get Lineage Node ID for an index."""
-        return self.idx_to_ln_id.get(idx)
+        if 0 <= idx < len(self.idx_to_ln_id):
+            return self.idx_to_ln_id[idx]
+        return None
 
     def remove(self, ln_id: str) -> None:
         """Remove a Lineage Node ID from mapping."""
-        if ln_id in self.ln_id_to_idx:
-            idx = self.ln_id_to_idx[ln_id]
-            del self.ln_id_to_idx[ln_id]
-            del self.idx_to_ln_id[idx]
+        idx = self.ln_id_to_idx.pop(ln_id, None)
+        if idx is not None:
+            self.idx_to_ln_id[idx] = None
+            self._ids_np = None
 
     def save(self, path: str) -> None:
-        """Save mapping to JSON file."""
+        """Save mapping to JSON file (the reverse list is derived, not stored)."""
         data = {
             "ln_id_to_idx": self.ln_id_to_idx,
-            "idx_to_ln_id": {str(k): v for k, v in self.idx_to_ln_id.items()},
             "next_idx": self.next_idx,
         }
         save_json(data, path)
@@ -68,8 +81,23 @@ class LNMapping:
             return
 
         self.ln_id_to_idx = data.get("ln_id_to_idx", {})
-        self.idx_to_ln_id = {int(k): v for k, v in data.get("idx_to_ln_id", {}).items()}
         self.next_idx = data.get("next_idx", len(self.ln_id_to_idx))
+        # Rebuild the dense reverse list; gaps from removed ids stay None
+        self.idx_to_ln_id = [None] * self.next_idx
+        for ln_id, idx in self.ln_id_to_idx.items():
+            self.idx_to_ln_id[idx] = ln_id
+        self._ids_np = None
+
+    def ids_array(self) -> np.ndarray:
+        """
+        Reverse mapping as an object array for fancy-indexed lookups.
+
+        Cached until the next mutation so result assembly can translate a
+        whole (nq, k) index matrix without a Python call per hit.
+        """
+        if self._ids_np is None:
+            self._ids_np = np.array(self.idx_to_ln_id, dtype=object)
+        return self._ids_np
 
     def __len__(self) -> int:
         """Return number of mappings."""
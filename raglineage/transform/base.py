@@ -1,7 +1,9 @@
 """Base transform interface."""
 
+import os
 from abc import ABC, abstractmethod
-from typing import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
 
 from raglineage.schemas.lineage_node import LineageNode
 
@@ -9,6 +11,11 @@ from raglineage.schemas.lineage_node import LineageNode
 class BaseTransform(ABC):
     """Base interface for transforms."""
 
+    # Stateful transforms (e.g. dedup's seen-set) set this False so
+    # transform_batch never ships them to worker processes, where each
+    # worker would mutate its own pickled copy of the state
+    parallel_safe = True
+
     @abstractmethod
     def transform(self, ln: LineageNode) -> Iterator[LineageNode]:
         """
@@ -22,6 +29,43 @@ class BaseTransform(ABC):
         """
         pass
 
+    def _transform_one(self, ln: LineageNode) -> list[LineageNode]:
+        """Materialized transform() for process-pool dispatch."""
+        return list(self.transform(ln))
+
+    def transform_batch(
+        self, lns: list[LineageNode], max_workers: Optional[int] = None
+    ) -> Iterator[LineageNode]:
+        """
+        Transform a batch of nodes, optionally sharded across processes.
+
+        Documents are independent, so chunking and normalization scale to
+        core count; the default stays sequential because process dispatch
+        only pays off for large batches of CPU-heavy work.
+
+        Args:
+            lns: Input Lineage Nodes
+            max_workers: Shard across this many worker processes when > 1
+                (ignored for transforms that are not parallel_safe)
+
+        Yields:
+            Transformed Lineage Node(s), in input order
+        """
+        if (
+            max_workers is None
+            or max_workers <= 1
+            or not self.parallel_safe
+            or len(lns) < 2
+        ):
+            for ln in lns:
+                yield from self.transform(ln)
+            return
+
+        workers = min(max_workers, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for out in ex.map(self._transform_one, lns, chunksize=16):
+                yield from out
+
     @property
     @abstractmethod
     def name(self) -> str:
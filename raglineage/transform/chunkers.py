@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Iterator
 
+import numpy as np
+
 from raglineage.schemas.lineage_node import LineageNode
 from raglineage.transform.base import BaseTransform
 from raglineage.utils.hashing import compute_content_hash
@@ -49,17 +51,13 @@ class SimpleChunker(ChunkingStrategy):
         if len(content) <= self.chunk_size:
             return [content]
 
-        chunks = []
-        start = 0
-        while start < len(content):
-            end = start + self.chunk_size
-            chunk = content[start:end]
-            chunks.append(chunk)
-            start = end - self.overlap
-            if start >= len(content):
-                break
-
-        return chunks
+        # Single comprehension over the chunk starts instead of a stateful
+        # while loop; same boundaries, no per-iteration bookkeeping
+        step = self.chunk_size - self.overlap
+        return [
+            content[start : start + self.chunk_size]
+            for start in range(0, len(content), step)
+        ]
 
 
 class SemanticChunker(ChunkingStrategy):
@@ -76,12 +74,20 @@ class SemanticChunker(ChunkingStrategy):
         self.chunk_size = chunk_size
         self.overlap = overlap
 
+    # Below this many sentences the numpy setup costs more than the loop
+    SEARCHSORTED_THRESHOLD = 64
+
     def chunk(self, content: str) -> list[str]:
         """Chunk content by sentences."""
-        # Simple sentence splitting (can be enhanced with NLP libraries)
-        sentences = content.replace(".\n", ". ").replace("\n", " ").split(". ")
+        # Simple sentence splitting (can be enhanced with NLP libraries).
+        # One newline pass suffices (".\n" becomes ". " by it anyway), and
+        # the boundary scan is memchr-backed str.split, not regex
+        sentences = content.replace("\n", " ").split(". ")
         sentences = [s.strip() + "." for s in sentences if s.strip()]
 
+        if len(sentences) >= self.SEARCHSORTED_THRESHOLD:
+            return self._chunk_searchsorted(sentences)
+
         chunks = []
         current_chunk = []
         current_size = 0
@@ -110,6 +116,39 @@ class SemanticChunker(ChunkingStrategy):
 
         return chunks if chunks else [content]
 
+    def _chunk_searchsorted(self, sentences: list[str]) -> list[str]:
+        """
+        Pack sentences into chunks by binary search over prefix sums.
+
+        Boundary-identical to the sequential loop in chunk(): a chunk ends
+        at the first sentence that would push it past chunk_size (checked
+        against cumulative lengths), and the next chunk starts at the
+        longest suffix of the previous one that fits in the overlap — both
+        found with np.searchsorted instead of per-sentence Python scans.
+        """
+        # prefix[i] = total length of the first i sentences (separators are
+        # not counted, matching the loop's current_size accounting)
+        prefix = np.zeros(len(sentences) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, sentences), dtype=np.int64), out=prefix[1:])
+
+        chunks = []
+        start = 0  # first sentence of the current chunk
+        forced = 0  # sentence appended without a size check (overlap carry)
+        n = len(sentences)
+        while True:
+            # First index whose sentence would overflow the chunk; the
+            # forced sentence is always included even if it overflows
+            end = int(np.searchsorted(prefix, prefix[start] + self.chunk_size, side="right")) - 1
+            end = max(end, forced + 1)
+            if end >= n:
+                chunks.append(" ".join(sentences[start:]))
+                return chunks
+            chunks.append(" ".join(sentences[start:end]))
+            # Longest suffix of [start, end) fitting in the overlap budget
+            carry = int(np.searchsorted(prefix, prefix[end] - self.overlap, side="left"))
+            start = max(carry, start)
+            forced = end
+
 
 class SimpleChunkerTransform(BaseTransform):
     """Transform that applies simple chunking."""
@@ -126,19 +165,28 @@ class SimpleChunkerTransform(BaseTransform):
     def transform(self, ln: LineageNode) -> Iterator[LineageNode]:
         """Chunk a Lineage Node into multiple nodes."""
         chunks = self.chunker.chunk(ln.content)
+        # Everything but content/index is identical across chunks; hoist it
+        # out of the loop (including the pydantic attribute reads)
+        parent_id = ln.ln_id
+        source = ln.source
+        dataset_version = ln.dataset_version
+        chain = ln.transform_chain + [self.name]
+        base_meta = ln.metadata
+        total = len(chunks)
+        created_at = datetime.utcnow()
         for idx, chunk_content in enumerate(chunks):
-            ln_id = f"{ln.ln_id}_chunk_{idx}"
-            content_hash = compute_content_hash(chunk_content)
-
-            yield LineageNode(
-                ln_id=ln_id,
+            # Inputs are already typed, so skip pydantic validation per chunk
+            yield LineageNode.model_construct(
+                ln_id=f"{parent_id}_chunk_{idx}",
                 content=chunk_content,
-                source=ln.source,
-                dataset_version=ln.dataset_version,
-                transform_chain=ln.transform_chain + [self.name],
-                content_hash=content_hash,
-                created_at=datetime.utcnow(),
-                metadata={**ln.metadata, "chunk_index": idx, "total_chunks": len(chunks)},
+                source=source,
+                dataset_version=dataset_version,
+                transform_chain=chain,
+                content_hash=compute_content_hash(chunk_content),
+                created_at=created_at,
+                parent_id=parent_id,
+                chunk_index=idx,
+                metadata={**base_meta, "chunk_index": idx, "total_chunks": total},
             )
 
 
@@ -157,17 +205,26 @@ class SemanticChunkerTransform(BaseTransform):
     def transform(self, ln: LineageNode) -> Iterator[LineageNode]:
         """Chunk a Lineage Node into multiple nodes."""
         chunks = self.chunker.chunk(ln.content)
+        # Everything but content/index is identical across chunks; hoist it
+        # out of the loop (including the pydantic attribute reads)
+        parent_id = ln.ln_id
+        source = ln.source
+        dataset_version = ln.dataset_version
+        chain = ln.transform_chain + [self.name]
+        base_meta = ln.metadata
+        total = len(chunks)
+        created_at = datetime.utcnow()
         for idx, chunk_content in enumerate(chunks):
-            ln_id = f"{ln.ln_id}_chunk_{idx}"
-            content_hash = compute_content_hash(chunk_content)
-
-            yield LineageNode(
-                ln_id=ln_id,
+            # Inputs are already typed, so skip pydantic validation per chunk
+            yield LineageNode.model_construct(
+                ln_id=f"{parent_id}_chunk_{idx}",
                 content=chunk_content,
-                source=ln.source,
-                dataset_version=ln.dataset_version,
-                transform_chain=ln.transform_chain + [self.name],
-                content_hash=content_hash,
-                created_at=datetime.utcnow(),
-                metadata={**ln.metadata, "chunk_index": idx, "total_chunks": len(chunks)},
+                source=source,
+                dataset_version=dataset_version,
+                transform_chain=chain,
+                content_hash=compute_content_hash(chunk_content),
+                created_at=created_at,
+                parent_id=parent_id,
+                chunk_index=idx,
+                metadata={**base_meta, "chunk_index": idx, "total_chunks": total},
             )
@@ -8,13 +8,30 @@ from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Hash digests are uniformly random, so 64 bits of prefix is ample for
+# dedup (birthday collisions near ~2^32 items) at a fraction of the
+# memory of full "algo:<hex>" strings.
+_KEY_MASK = (1 << 64) - 1
+
+
+def _hash_key(content_hash: str) -> int:
+    """Fold a prefixed hex digest into a 64-bit integer set key."""
+    digest = content_hash.split(":", 1)[-1]
+    try:
+        return int(digest[:16], 16)
+    except ValueError:
+        return hash(content_hash) & _KEY_MASK
+
 
 class DedupeTransform(BaseTransform):
     """Deduplication transform that filters duplicate content."""
 
+    # The seen-set is shared state; sharding would dedupe per-shard only
+    parallel_safe = False
+
     def __init__(self) -> None:
         """Initialize dedupe transform."""
-        self.seen_hashes: set[str] = set()
+        self.seen_hashes: set[int] = set()
 
     @property
     def name(self) -> str:
@@ -23,21 +40,15 @@ class DedupeTransform(BaseTransform):
 
     def transform(self, ln: LineageNode) -> Iterator[LineageNode]:
         """Filter out duplicate nodes based on content hash."""
-        if ln.content_hash in self.seen_hashes:
+        key = _hash_key(ln.content_hash)
+        if key in self.seen_hashes:
             logger.debug(f"Skipping duplicate: {ln.ln_id}")
             return
 
-        self.seen_hashes.add(ln.content_hash)
-        yield LineageNode(
-            ln_id=ln.ln_id,
-            content=ln.content,
-            source=ln.source,
-            dataset_version=ln.dataset_version,
-            transform_chain=ln.transform_chain + [self.name],
-            content_hash=ln.content_hash,
-            created_at=ln.created_at,
-            updated_at=ln.updated_at,
-            metadata=ln.metadata,
+        self.seen_hashes.add(key)
+        # model_copy skips pydantic re-validation; only the chain changes
+        yield ln.model_copy(
+            update={"transform_chain": ln.transform_chain + [self.name]}
         )
 
     def reset(self) -> None:
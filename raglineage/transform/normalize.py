@@ -11,6 +11,10 @@ from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once; re.sub with a literal still pays a cache lookup per call
+_WS_RE = re.compile(r"\s+")
+_STRIP_RE = re.compile(r"[^\w\s.,!?;:-]")
+
 
 class NormalizeTransform(BaseTransform):
     """Text normalization transform (cleanup, whitespace, etc.)."""
@@ -34,24 +38,23 @@ class NormalizeTransform(BaseTransform):
         content = ln.content
 
         # Basic normalization
-        content = re.sub(r"\s+", " ", content)  # Normalize whitespace
+        content = _WS_RE.sub(" ", content)  # Normalize whitespace
         content = content.strip()
 
         if self.aggressive:
             # Aggressive normalization
-            content = re.sub(r"[^\w\s.,!?;:-]", "", content)  # Remove special chars
+            content = _STRIP_RE.sub("", content)  # Remove special chars
             content = content.lower()
 
         content_hash = compute_content_hash(content)
 
-        yield LineageNode(
-            ln_id=ln.ln_id,
-            content=content,
-            source=ln.source,
-            dataset_version=ln.dataset_version,
-            transform_chain=ln.transform_chain + [self.name],
-            content_hash=content_hash,
-            created_at=ln.created_at,
-            updated_at=datetime.utcnow(),
-            metadata={**ln.metadata, "normalization_aggressive": self.aggressive},
+        # Everything else carries over unchanged, so copy instead of rebuilding
+        yield ln.model_copy(
+            update={
+                "content": content,
+                "content_hash": content_hash,
+                "transform_chain": ln.transform_chain + [self.name],
+                "updated_at": datetime.utcnow(),
+                "metadata": {**ln.metadata, "normalization_aggressive": self.aggressive},
+            }
         )
@@ -3,6 +3,7 @@
 from raglineage.utils.hashing import compute_content_hash, compute_file_hash
 from raglineage.utils.io import ensure_dir, load_json, save_json
 from raglineage.utils.logging import get_logger
+from raglineage.utils.walk import iter_files
 
 __all__ = [
     "compute_content_hash",
@@ -11,4 +12,5 @@ __all__ = [
     "load_json",
     "save_json",
     "get_logger",
+    "iter_files",
 ]
@@ -2,36 +2,86 @@
 
 import hashlib
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
-def compute_content_hash(content: str) -> str:
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Large reads keep file hashing memory-bandwidth-bound instead of syscall-bound
+_READ_SIZE = 1 << 20
+
+# Process-wide default for compute_content_hash, set from config
+_content_hash_algo = "auto"
+
+
+def set_content_hash_algo(algo: str) -> None:
+    """
+    Set the process-wide content hash algorithm.
+
+    Args:
+        algo: One of 'auto', 'xxh3', 'blake2b', 'sha256'
+    """
+    global _content_hash_algo
+    _content_hash_algo = algo
+
+
+def compute_content_hash(content: Union[str, bytes], algo: Optional[str] = None) -> str:
     """
-    Compute SHA-256 hash of content.
+    Compute content hash for a chunk.
+
+    Change detection and dedupe within a build don't need cryptographic
+    strength, so 'auto' prefers xxHash (xxh3, ~20x faster than SHA-256) and
+    falls back to keyed-capable BLAKE2b from the stdlib. SHA-256 remains
+    available for deployments that need a cryptographic digest. The
+    algorithm is encoded in the prefix so stored hashes stay
+    self-describing.
 
     Args:
-        content: Text content to hash
+        content: Text content to hash (str, or already-encoded UTF-8 bytes
+            so callers holding raw buffers can skip a round of encoding)
+        algo: Override the configured algorithm for this call
 
     Returns:
-        SHA-256 hash as hex string with 'sha256:' prefix
+        Hash as hex string with algorithm prefix (e.g. 'xxh3:...')
     """
-    hash_obj = hashlib.sha256(content.encode("utf-8"))
-    return f"sha256:{hash_obj.hexdigest()}"
+    algo = algo or _content_hash_algo
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if algo == "sha256":
+        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+    if algo == "blake3" and blake3 is not None:
+        return f"blake3:{blake3.blake3(data).hexdigest()}"
+    if algo in ("blake2b", "blake3") or (algo in ("auto", "xxh3") and xxhash is None):
+        return f"blake2b:{hashlib.blake2b(data, digest_size=16).hexdigest()}"
+    return f"xxh3:{xxhash.xxh3_128(data).hexdigest()}"
 
 
 def compute_file_hash(file_path: Union[Path, str]) -> str:
     """
-    Compute SHA-256 hash of file contents.
+    Compute hash of file contents for change detection.
+
+    Uses multi-threaded BLAKE3 when installed, otherwise stdlib BLAKE2b —
+    both considerably faster than SHA-256 while keeping collision resistance
+    for manifest comparisons.
 
     Args:
         file_path: Path to file
 
     Returns:
-        SHA-256 hash as hex string
+        Hash as hex string
     """
     file_path = Path(file_path)
-    hash_obj = hashlib.sha256()
+    if blake3 is not None:
+        hash_obj = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    else:
+        hash_obj = hashlib.blake2b(digest_size=32)
     with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(_READ_SIZE), b""):
             hash_obj.update(chunk)
     return hash_obj.hexdigest()
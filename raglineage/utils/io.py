@@ -1,9 +1,15 @@
 """I/O utilities for file operations."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from raglineage.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -38,6 +44,8 @@ def load_json(file_path: Union[Path, str]) -> Any:
     if not file_path.exists():
         logger.warning(f"JSON file not found: {file_path}")
         return None
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
     with file_path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -53,5 +61,12 @@ def save_json(data: Any, file_path: Union[Path, str], indent: int = 2) -> None:
     """
     file_path = Path(file_path)
     ensure_dir(file_path.parent)
-    with file_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # Write-then-rename so concurrent readers never see a partial file
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        tmp_path.write_bytes(orjson.dumps(data, option=option))
+    else:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp_path, file_path)
@@ -0,0 +1,30 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+
+import pytest
+
+from raglineage import RagLineage
+
+
+@pytest.fixture(scope="session")
+def rag_with_data(tmp_path_factory: pytest.TempPathFactory) -> tuple[RagLineage, Path]:
+    """
+    A RagLineage instance built once over the small e2e corpus.
+
+    Loading the embedding model and building the index dwarf the test
+    bodies, so the build is shared for the whole session; tests that change
+    the corpus add new versions instead of rebuilding from scratch.
+    """
+    source_dir = tmp_path_factory.mktemp("data")
+
+    (source_dir / "policy.txt").write_text(
+        "Refund Policy: 30 days return window. Contact support for refunds."
+    )
+    (source_dir / "products.csv").write_text(
+        "product_id,name,price\n1,Widget,29.99\n2,Gadget,49.99"
+    )
+
+    rag = RagLineage(source=str(source_dir), chunk_size=50)
+    rag.build(version="v1.0")
+    return rag, source_dir
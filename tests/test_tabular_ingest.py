@@ -0,0 +1,62 @@
+"""Parity tests for tabular ingestion across optional parsers.
+
+The pyarrow/ijson fast paths and the stdlib fallbacks must produce
+byte-identical node content and content hashes, or lineage hashes, dedupe,
+and embedding-cache keys would depend on which packages happen to be
+installed.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import raglineage.ingest.tabular as tabular
+from raglineage.ingest.tabular import TabularIngestor
+
+
+def _contents_and_hashes(path: Path) -> list[tuple[str, str]]:
+    return [
+        (ln.content, ln.content_hash) for ln in TabularIngestor().ingest(path)
+    ]
+
+
+def test_csv_parity_with_stdlib_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """pyarrow and csv.DictReader must hash every row identically."""
+    pytest.importorskip("pyarrow")
+    sample = tmp_path / "sample.csv"
+    sample.write_text(
+        "product_id,name,price,notes\n"
+        "1,Widget,29.99,\n"
+        "2,Gadget,49.99,NULL\n"
+        '3,"Thing, big",0.5,unicode ok\n',
+        encoding="utf-8",
+    )
+
+    with_pyarrow = _contents_and_hashes(sample)
+    monkeypatch.setattr(tabular, "pa_csv", None)
+    with_stdlib = _contents_and_hashes(sample)
+
+    assert with_pyarrow == with_stdlib
+    assert len(with_stdlib) == 3
+
+
+def test_json_parity_with_stdlib_fallback(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """ijson streaming and json.load must hash every row identically."""
+    pytest.importorskip("ijson")
+    sample = tmp_path / "sample.json"
+    sample.write_text(
+        '[{"id": 1, "name": "Widget", "price": 29.99},'
+        ' {"id": 2, "name": "Gadget", "price": 3.0, "tags": ["a", "b"]}]',
+        encoding="utf-8",
+    )
+
+    with_ijson = _contents_and_hashes(sample)
+    monkeypatch.setattr(tabular, "ijson", None)
+    with_stdlib = _contents_and_hashes(sample)
+
+    assert with_ijson == with_stdlib
+    assert len(with_stdlib) == 2